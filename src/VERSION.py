@@ -4,33 +4,66 @@ User-configurable variables - modify as needed
 """
 import os
 import getpass
+from functools import lru_cache
+from typing import NamedTuple
 
-# User configuration
-USER = os.getenv('USER', getpass.getuser())
-USER_EMAIL = os.getenv('USER_EMAIL', f"{USER}@{os.getenv('COMPANY_DOMAIN', 'example.com')}")
-COMPANY_NAME = os.getenv('COMPANY_NAME', 'Your Company')
-COMPANY_DOMAIN = os.getenv('COMPANY_DOMAIN', 'example.com')
+# User configuration - resolved once per process on first use
+_env = os.environ
 
-"""
-User-configurable variables - modify as needed
-"""
-import os
-import getpass
+@lru_cache(maxsize=1)
+def user():
+    """Login name, falling back to getpass only when USER is unset"""
+    return _env.get('USER') or getpass.getuser()
+
+@lru_cache(maxsize=1)
+def company_name():
+    """Company display name"""
+    return _env.get('COMPANY_NAME', 'Your Company')
 
-# User configuration
-USER = os.getenv('USER', getpass.getuser())
-USER_EMAIL = os.getenv('USER_EMAIL', f"{USER}@{os.getenv('COMPANY_DOMAIN', 'example.com')}")
-COMPANY_NAME = os.getenv('COMPANY_NAME', 'Your Company')
-COMPANY_DOMAIN = os.getenv('COMPANY_DOMAIN', 'example.com')
+@lru_cache(maxsize=1)
+def company_domain():
+    """Company e-mail/web domain"""
+    return _env.get('COMPANY_DOMAIN', 'example.com')
+
+@lru_cache(maxsize=1)
+def user_email():
+    """User e-mail, derived from user() and company_domain() when unset"""
+    return _env.get('USER_EMAIL') or (user() + "@" + company_domain())
+
+# Legacy module-level names, served lazily by __getattr__
+_USER_CONFIG = {
+    'USER': user,
+    'USER_EMAIL': user_email,
+    'COMPANY_NAME': company_name,
+    'COMPANY_DOMAIN': company_domain,
+}
 
 # Business Tools Browser - Version Information
 
-VERSION = "1.0.0"
-BUILD_DATE = "2025-07-22"
-DESCRIPTION = "Unified Business Tools Browser Application"
+class _BuildInfo(NamedTuple):
+    """Immutable release metadata"""
+    version: str
+    build_date: str
+    description: str
+
+BUILD_INFO = _BuildInfo("1.0.0", "2025-07-22", "Unified Business Tools Browser Application")
+
+# Aliases kept for existing importers
+VERSION = BUILD_INFO.version
+BUILD_DATE = BUILD_INFO.build_date
+DESCRIPTION = BUILD_INFO.description
+
+# Changelog - built on first access via module __getattr__ (PEP 562)
+_CHANGELOG_TEXT = None
 
-# Changelog
-CHANGELOG = """
+def __getattr__(name):
+    """Resolve user configuration and the changelog text on first access"""
+    global _CHANGELOG_TEXT
+    if name in _USER_CONFIG:
+        return _USER_CONFIG[name]()
+    if name == "CHANGELOG":
+        if _CHANGELOG_TEXT is None:
+            _CHANGELOG_TEXT = """
 Version 1.0.0 (2025-07-22)
 - Initial release
 - Unified application combining GUI, CLI, and data processing
@@ -41,3 +74,5 @@ Version 1.0.0 (2025-07-22)
 - Automatic Excel file processing
 - URL validation and categorization
 """
+        return _CHANGELOG_TEXT
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
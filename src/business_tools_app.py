@@ -5,64 +5,167 @@ Handles multiple file types, link validation, data formatting, and master CSV cr
 """
 
 import argparse
+import asyncio
 import csv
+import hashlib
 import json
 import os
+import re
+import sqlite3
 import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import font as tkfont
 from pathlib import Path
+import numpy as np
 import pandas as pd
+try:
+ # Optional: multithreaded CSV writer and the Parquet copy of the master data
+ import pyarrow as pa
+ import pyarrow.csv as pacsv
+ import pyarrow.parquet as pq
+except ImportError:
+ pa = None
+try:
+ # Optional: asyncio link validation on a single thread
+ import httpx
+except ImportError:
+ httpx = None
+try:
+ # Optional: Aho-Corasick keyword automaton (pyahocorasick) for access classification
+ import ahocorasick
+except ImportError:
+ ahocorasick = None
+try:
+ # Optional (installed with requests): encoding detection for non-UTF-8 CSV files
+ import charset_normalizer
+except ImportError:
+ charset_normalizer = None
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from functools import cached_property, wraps
 import threading
-from queue import Queue
+from collections import defaultdict
+from queue import Queue, Empty
 
 # Application directories
 APP_DIR = Path(__file__).parent.parent
 DATA_DIR = APP_DIR / "data"
 RESOURCES_DIR = APP_DIR / "resources"
+DF_CACHE_DIR = DATA_DIR / "_cache"
 
 # Ensure directories exist
 DATA_DIR.mkdir(exist_ok=True)
 RESOURCES_DIR.mkdir(exist_ok=True)
 
+# Access classification: internal indicators win over public ones
+INTERNAL_KEYWORDS = ['internal', 'intranet', 'private', 'corp', 'company', 'localhost', '192.168', '10.0', '172.16']
+PUBLIC_KEYWORDS = ['public', 'open', 'free', 'community', 'github', 'google', 'microsoft']
+_INTERNAL_RE = re.compile('|'.join(map(re.escape, INTERNAL_KEYWORDS)))
+_PUBLIC_RE = re.compile('|'.join(map(re.escape, PUBLIC_KEYWORDS)))
+_PUBLIC_DOMAIN_RE = re.compile(r'\.(?:com|org|net|gov|edu)')
+if ahocorasick is not None:
+ # All keywords in one automaton: a single linear scan per row finds both kinds
+ _ACCESS_AUTOMATON = ahocorasick.Automaton()
+ for keyword in INTERNAL_KEYWORDS:
+ _ACCESS_AUTOMATON.add_word(keyword, 'Internal')
+ for keyword in PUBLIC_KEYWORDS:
+ _ACCESS_AUTOMATON.add_word(keyword, 'Public')
+ _ACCESS_AUTOMATON.make_automaton()
+
+def normalize_url(url):
+ """Key under which spellings of the same link compare equal (case, fragment, trailing slash)"""
+ text = str(url).strip().lower()
+ return urlparse(text)._replace(fragment='').geturl().rstrip('/')
+
+def cache_df(reader):
+ """Keep a Parquet snapshot of a file reader's result, keyed on the file's path, mtime and size"""
+ @wraps(reader)
+ def wrapper(self, file_path):
+ try:
+ path = Path(file_path).resolve()
+ st = path.stat()
+ except OSError:
+ return reader(self, file_path)
+ if pa is None:
+ return reader(self, file_path)
+ 
+ key = hashlib.sha1(f"{path}|{st.st_mtime_ns}|{st.st_size}".encode()).hexdigest()
+ cache_file = DF_CACHE_DIR / f"{key}.parquet"
+ if cache_file.exists():
+ try:
+ return pd.read_parquet(cache_file)
+ except Exception:
+ pass # Unreadable snapshot: parse the file again
+ 
+ df = reader(self, file_path)
+ try:
+ # Write under a unique name and rename, so parallel workers never see a partial file
+ DF_CACHE_DIR.mkdir(exist_ok=True)
+ tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+ df.to_parquet(tmp_file, index=False)
+ os.replace(tmp_file, cache_file)
+ except Exception:
+ pass # Columns Arrow cannot store: this file is simply not cached
+ return df
+ return wrapper
+
 class LinkValidator:
  """Validates URLs and checks their accessibility"""
  
- def __init__(self, timeout=10, max_workers=20):
+ def __init__(self, timeout=10, max_workers=20, per_host=4, cache_ttl=24 * 3600, cache_path=None):
  self.timeout = timeout
  self.max_workers = max_workers
+ self.per_host = per_host
+ self.cache_ttl = cache_ttl
+ # At most per_host requests in flight to any one host, whatever the worker count
+ self._host_sems = defaultdict(lambda: threading.Semaphore(self.per_host))
+ self._sems_lock = threading.Lock()
  self.session = requests.Session()
  self.session.headers.update({
  'User-Agent': 'Mozilla/5.0 (Linux; Business Tools Browser) Link Validator/1.0'
  })
  
+ # One keep-alive connection per worker, so no worker has to reconnect to a host it just used
+ retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+ raise_on_status=False)
+ adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers,
+ pool_block=True, max_retries=retry)
+ self.session.mount('https://', adapter)
+ self.session.mount('http://', adapter)
+ 
+ # Persistent link cache: normalized URL -> last HTTP result, shared by the worker threads
+ self._cache_lock = threading.Lock()
+ try:
+ self._cache_db = sqlite3.connect(str(cache_path or DATA_DIR / 'link_cache.sqlite'), check_same_thread=False)
+ self._cache_db.execute('PRAGMA journal_mode=WAL')
+ self._cache_db.execute('PRAGMA synchronous=NORMAL')
+ self._cache_db.execute('CREATE TABLE IF NOT EXISTS link_cache '
+ '(url TEXT PRIMARY KEY, status TEXT, code INT, message TEXT, checked REAL, etag TEXT)')
+ except sqlite3.Error as e:
+ print(f"Link cache disabled: {e}")
+ self._cache_db = None
+ 
  def validate_url(self, url):
  """Validate a single URL"""
- if not url or pd.isna(url) or str(url).strip() == '':
- return {'url': url, 'status': 'empty', 'code': None, 'message': 'Empty URL'}
- 
- url = str(url).strip()
- if not url.startswith(('http://', 'https://')):
- if url.startswith('www.'):
- url = 'https://' + url
- elif '.' in url:
- url = 'https://' + url
- else:
- return {'url': url, 'status': 'invalid', 'code': None, 'message': 'Invalid URL format'}
+ url, result, cached, headers = self._prepare_check(url)
+ if result is not None:
+ return result
  
  try:
- response = self.session.head(url, timeout=self.timeout, allow_redirects=True)
+ with self._host_semaphore(url):
+ response = self.session.head(url, timeout=self.timeout, allow_redirects=True, headers=headers)
  if response.status_code == 405: # Method Not Allowed, try GET
- response = self.session.get(url, timeout=self.timeout, allow_redirects=True)
+ # Only the status line and headers are needed; closing skips the body download
+ with self.session.get(url, timeout=self.timeout, allow_redirects=True, headers=headers,
+ stream=True) as response:
+ pass
  
- if response.status_code < 400:
- return {'url': url, 'status': 'valid', 'code': response.status_code, 'message': 'OK'}
- else:
- return {'url': url, 'status': 'error', 'code': response.status_code, 'message': f'HTTP {response.status_code}'}
+ return self._record_response(url, cached, headers, response.status_code, response.headers.get('ETag'))
  
  except requests.exceptions.Timeout:
  return {'url': url, 'status': 'timeout', 'code': None, 'message': 'Timeout'}
@@ -73,17 +176,142 @@ class LinkValidator:
  except Exception as e:
  return {'url': url, 'status': 'error', 'code': None, 'message': f'Unexpected error: {str(e)}'}
  
+ async def _validate_one(self, client, url, host_sems, slots):
+ """Validate a single URL on the event loop (same results as validate_url)"""
+ url, result, cached, headers = self._prepare_check(url)
+ if result is not None:
+ return result
+ 
+ try:
+ # Per-host politeness, then a free pool connection, so no request times out queued in the pool
+ async with host_sems[urlparse(url).netloc], slots:
+ response = await client.head(url, headers=headers)
+ if response.status_code == 405: # Method Not Allowed, try GET
+ # Only the status line and headers are needed; leaving the stream skips the body
+ async with client.stream('GET', url, headers=headers) as response:
+ pass
+ 
+ return self._record_response(url, cached, headers, response.status_code, response.headers.get('ETag'))
+ 
+ except httpx.TimeoutException:
+ return {'url': url, 'status': 'timeout', 'code': None, 'message': 'Timeout'}
+ except httpx.ConnectError:
+ return {'url': url, 'status': 'connection_error', 'code': None, 'message': 'Connection failed'}
+ except httpx.HTTPError as e:
+ return {'url': url, 'status': 'error', 'code': None, 'message': str(e)}
+ except Exception as e:
+ return {'url': url, 'status': 'error', 'code': None, 'message': f'Unexpected error: {str(e)}'}
+ 
+ def _prepare_check(self, url):
+ """
+ Clean up a URL and consult the cache before any request is made.
+ Returns (url, result, cached, headers): result is final when no request is needed,
+ and headers make the request conditional on a stale cached entry's ETag.
+ """
+ if not url or pd.isna(url) or str(url).strip() == '':
+ return url, {'url': url, 'status': 'empty', 'code': None, 'message': 'Empty URL'}, None, None
+ 
+ url = str(url).strip()
+ if not url.startswith(('http://', 'https://')):
+ if url.startswith('www.'):
+ url = 'https://' + url
+ elif '.' in url:
+ url = 'https://' + url
+ else:
+ return url, {'url': url, 'status': 'invalid', 'code': None, 'message': 'Invalid URL format'}, None, None
+ 
+ # Results checked within cache_ttl are reused; older ones with an ETag are revalidated conditionally
+ cached = self._cache_lookup(normalize_url(url))
+ if cached is not None and time.time() - cached['checked'] < self.cache_ttl:
+ return url, {'url': url, 'status': cached['status'], 'code': cached['code'], 'message': cached['message']}, cached, None
+ headers = {'If-None-Match': cached['etag']} if cached is not None and cached['etag'] else None
+ return url, None, cached, headers
+ 
+ def _record_response(self, url, cached, headers, status_code, etag):
+ """Turn an HTTP status into a validation result and cache it"""
+ if status_code == 304 and headers:
+ # Not modified since the cached check
+ result = {'url': url, 'status': cached['status'], 'code': cached['code'], 'message': cached['message']}
+ etag = cached['etag']
+ elif status_code < 400:
+ result = {'url': url, 'status': 'valid', 'code': status_code, 'message': 'OK'}
+ else:
+ result = {'url': url, 'status': 'error', 'code': status_code, 'message': f'HTTP {status_code}'}
+ self._cache_store(normalize_url(url), result, etag)
+ return result
+ 
+ def _cache_lookup(self, key):
+ """Cached result for a normalized URL, or None"""
+ if self._cache_db is None:
+ return None
+ with self._cache_lock:
+ row = self._cache_db.execute('SELECT status, code, message, checked, etag FROM link_cache WHERE url = ?',
+ (key,)).fetchone()
+ if row is None:
+ return None
+ return dict(zip(('status', 'code', 'message', 'checked', 'etag'), row))
+ 
+ def _cache_store(self, key, result, etag):
+ """Remember the HTTP result for a normalized URL"""
+ if self._cache_db is None:
+ return
+ with self._cache_lock:
+ self._cache_db.execute('INSERT OR REPLACE INTO link_cache VALUES (?, ?, ?, ?, ?, ?)',
+ (key, result['status'], result['code'], result['message'], time.time(), etag))
+ self._cache_db.commit()
+ 
+ def _host_semaphore(self, url):
+ """Semaphore limiting concurrent requests to the host of url"""
+ host = urlparse(url).netloc
+ with self._sems_lock:
+ return self._host_sems[host]
+ 
  def validate_urls_batch(self, urls, progress_callback=None):
- """Validate multiple URLs with progress tracking"""
- results = []
- total = len(urls)
+ """Validate multiple URLs with progress tracking; results are in the order of urls"""
+ # Probe each distinct link once, then fan its result out to every position that has it
+ keys = [normalize_url(url) for url in urls]
+ unique = {}
+ for key, url in zip(keys, urls):
+ unique.setdefault(key, url)
+ results = {}
+ total = len(unique)
+ 
+ if httpx is not None:
+ # Hundreds of checks multiplexed on one event loop instead of a thread per check
+ results = asyncio.run(self._validate_all(unique, progress_callback))
+ return [results[key] for key in keys]
  
  with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
- future_to_url = {executor.submit(self.validate_url, url): url for url in urls}
+ future_to_key = {executor.submit(self.validate_url, url): key for key, url in unique.items()}
  
- for i, future in enumerate(as_completed(future_to_url)):
+ for i, future in enumerate(as_completed(future_to_key)):
  result = future.result()
- results.append(result)
+ results[future_to_key[future]] = result
+ 
+ if progress_callback:
+ progress_callback(i + 1, total, result)
+ 
+ return [results[key] for key in keys]
+ 
+ async def _validate_all(self, unique, progress_callback=None):
+ """Validate {key: url} concurrently with httpx; returns {key: result}"""
+ results = {}
+ total = len(unique)
+ max_connections = 200
+ limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=50)
+ host_sems = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+ slots = asyncio.Semaphore(max_connections)
+ 
+ async def check(key, url):
+ return key, await self._validate_one(client, url, host_sems, slots)
+ 
+ async with httpx.AsyncClient(headers={'User-Agent': self.session.headers['User-Agent']},
+ transport=httpx.AsyncHTTPTransport(retries=2, limits=limits),
+ timeout=self.timeout, follow_redirects=True) as client:
+ tasks = [check(key, url) for key, url in unique.items()]
+ for i, task in enumerate(asyncio.as_completed(tasks)):
+ key, result = await task
+ results[key] = result
  
  if progress_callback:
  progress_callback(i + 1, total, result)
@@ -95,9 +323,9 @@ class DataProcessor:
  
  def __init__(self):
  self.master_csv = DATA_DIR / "Master_Tools.csv"
+ self.master_parquet = self.master_csv.with_suffix('.parquet')
  self.validation_report = DATA_DIR / "Link_Validation_Report.csv"
  self.supported_formats = ['.xlsx', '.xls', '.csv']
- self.link_validator = LinkValidator()
  
  # Standard column mappings
  self.column_mappings = {
@@ -108,6 +336,15 @@ class DataProcessor:
  'access': ['access', 'availability', 'access_type', 'public', 'internal'],
  'notes': ['notes', 'comments', 'remarks', 'additional_info']
  }
+ # Lowercased variation -> (standard name, priority); the earliest listed variation wins
+ self._var_to_std = {variation.lower(): (standard_col, rank)
+ for standard_col, variations in self.column_mappings.items()
+ for rank, variation in enumerate(variations)}
+ 
+ @cached_property
+ def link_validator(self):
+ """Link validator, created on first use (file-loading workers never need one)"""
+ return LinkValidator()
  
  def detect_file_format(self, file_path):
  """Detect and validate file format"""
@@ -121,6 +358,27 @@ class DataProcessor:
  
  return suffix
  
+ def sniff_encoding(self, file_path):
+ """Text encoding of a file, judged from its first 64 KB"""
+ with open(file_path, 'rb') as f:
+ sample = f.read(65536)
+ try:
+ sample.decode('utf-8')
+ return 'utf-8'
+ except UnicodeDecodeError as e:
+ if e.start >= len(sample) - 3 and e.reason == 'unexpected end of data':
+ return 'utf-8' # The sample ends inside a multi-byte character
+ if charset_normalizer is not None:
+ best = charset_normalizer.from_bytes(sample).best()
+ if best is not None:
+ return best.encoding
+ return 'latin-1'
+ 
+ def is_mapped_column(self, col):
+ """Whether an input column maps to a standard column (other columns are never parsed)"""
+ return str(col).lower().strip() in self._var_to_std
+ 
+ @cache_df
  def read_file(self, file_path):
  """Read file based on its format"""
  file_format = self.detect_file_format(file_path)
@@ -128,88 +386,83 @@ class DataProcessor:
  try:
  if file_format in ['.xlsx', '.xls']:
  # Try to read Excel file, handle multiple sheets
- df = pd.read_excel(file_path, sheet_name=None)
+ # Cells are read as text with the Rust calamine reader when python-calamine is installed
+ try:
+ df = pd.read_excel(file_path, sheet_name=None, engine='calamine', dtype=str, usecols=self.is_mapped_column)
+ except ImportError:
+ df = pd.read_excel(file_path, sheet_name=None, dtype=str, usecols=self.is_mapped_column)
  if isinstance(df, dict):
- # Multiple sheets - combine them
- combined_df = pd.DataFrame()
+ # Multiple sheets - tag each one and combine them in a single concat
+ frames = []
  for sheet_name, sheet_df in df.items():
  sheet_df['source_sheet'] = sheet_name
- combined_df = pd.concat([combined_df, sheet_df], ignore_index=True)
- return combined_df
+ frames.append(sheet_df)
+ return pd.concat(frames, ignore_index=True)
  else:
  return df
  
  elif file_format == '.csv':
- return pd.read_csv(file_path, encoding='utf-8')
+ return pd.read_csv(file_path, encoding=self.sniff_encoding(file_path), dtype=str,
+ usecols=self.is_mapped_column, engine='c')
  
  except Exception as e:
  # Try different encodings for CSV
  if file_format == '.csv':
  for encoding in ['latin-1', 'cp1252', 'iso-8859-1']:
  try:
- return pd.read_csv(file_path, encoding=encoding)
+ return pd.read_csv(file_path, encoding=encoding, dtype=str, usecols=self.is_mapped_column, engine='c')
  except:
  continue
  raise Exception(f"Failed to read file {file_path}: {str(e)}")
  
  def standardize_columns(self, df):
  """Standardize column names based on mappings"""
- df_copy = df.copy()
- 
- # Create a mapping of current columns to standard names
- column_map = {}
- current_columns = [col.lower().strip() for col in df_copy.columns]
- 
- for standard_col, variations in self.column_mappings.items():
- for variation in variations:
- if variation.lower() in current_columns:
- original_col = df_copy.columns[current_columns.index(variation.lower())]
- column_map[original_col] = standard_col
- break
- 
- # Rename columns
- df_copy = df_copy.rename(columns=column_map)
- 
- # Ensure all standard columns exist
- for standard_col in self.column_mappings.keys():
- if standard_col not in df_copy.columns:
- df_copy[standard_col] = ''
- 
- # Add metadata columns
- df_copy['source_file'] = ''
- df_copy['date_processed'] = pd.Timestamp.now().isoformat()
- df_copy['link_status'] = ''
- df_copy['link_code'] = ''
- df_copy['link_message'] = ''
- 
- return df_copy
- 
- def classify_tool_access(self, row):
- """Enhanced tool classification"""
- url = str(row.get('url', '')).lower()
- description = str(row.get('description', '')).lower()
- name = str(row.get('name', '')).lower()
- 
- # Internal indicators
- internal_keywords = ['internal', 'intranet', 'private', 'corp', 'company', 'localhost', '192.168', '10.0', '172.16']
- # Public indicators
- public_keywords = ['public', 'open', 'free', 'community', 'github', 'google', 'microsoft']
- 
- # Check URL for internal indicators
- for keyword in internal_keywords:
- if keyword in url or keyword in description or keyword in name:
- return 'Internal'
- 
- # Check for public indicators
- for keyword in public_keywords:
- if keyword in url or keyword in description or keyword in name:
- return 'Public'
- 
- # Default classification based on URL
- if any(domain in url for domain in ['.com', '.org', '.net', '.gov', '.edu']):
- return 'Public'
- 
- return 'Unknown'
+ # Pick, for each standard name, the current column matching its highest-priority variation
+ best = {}
+ for col in df.columns:
+ match = self._var_to_std.get(str(col).lower().strip())
+ if match is not None:
+ standard_col, rank = match
+ if standard_col not in best or rank < best[standard_col][1]:
+ best[standard_col] = (col, rank)
+ column_map = {col: standard_col for standard_col, (col, _) in best.items()}
+ 
+ # Rename columns (a new frame sharing the data; the input is left as it was)
+ df = df.rename(columns=column_map)
+ 
+ # Ensure all standard columns exist and add metadata columns in one step
+ missing = {standard_col: '' for standard_col in self.column_mappings if standard_col not in df.columns}
+ return df.assign(
+ **missing,
+ source_file='',
+ date_processed=pd.Timestamp.now().isoformat(),
+ link_status='',
+ link_code='',
+ link_message=''
+ )
+ 
+ def classify_tool_access(self, df):
+ """Enhanced tool classification for every row of a standardized dataframe"""
+ url = df['url'].fillna('').astype(str).str.lower()
+ # Keywords never contain spaces, so one joined haystack per row matches like the three fields
+ haystack = url + ' ' + df['description'].fillna('').astype(str).str.lower() + ' ' + df['name'].fillna('').astype(str).str.lower()
+ 
+ if ahocorasick is not None:
+ kinds = [{kind for _, kind in _ACCESS_AUTOMATON.iter(text)} for text in haystack]
+ internal = np.fromiter(('Internal' in found for found in kinds), dtype=bool, count=len(kinds))
+ public = np.fromiter(('Public' in found for found in kinds), dtype=bool, count=len(kinds))
+ else:
+ internal = haystack.str.contains(_INTERNAL_RE).to_numpy(dtype=bool)
+ public = haystack.str.contains(_PUBLIC_RE).to_numpy(dtype=bool)
+ 
+ # Internal indicators, then public indicators, then a public domain in the URL
+ return np.select(
+ [internal,
+ public,
+ url.str.contains(_PUBLIC_DOMAIN_RE).to_numpy(dtype=bool)],
+ ['Internal', 'Public', 'Public'],
+ default='Unknown'
+ )
  
  def validate_links_with_progress(self, df, progress_callback=None):
  """Validate all links in the dataframe with progress tracking"""
@@ -224,38 +477,36 @@ class DataProcessor:
  
  validation_results = self.link_validator.validate_urls_batch(urls, update_progress)
  
- # Update dataframe with validation results
- for i, result in enumerate(validation_results):
- df.loc[i, 'link_status'] = result['status']
- df.loc[i, 'link_code'] = result['code'] if result['code'] else ''
- df.loc[i, 'link_message'] = result['message']
+ # Update dataframe with validation results (one per row, in row order)
+ df['link_status'] = [result['status'] for result in validation_results]
+ df['link_code'] = [str(result['code']) if result['code'] else '' for result in validation_results]
+ df['link_message'] = [result['message'] for result in validation_results]
  
  return df
  
  def process_files(self, file_paths, progress_callback=None):
  """Process multiple files and create master CSV"""
- all_data = []
+ total = len(file_paths)
+ frames = [None] * total
  
- for i, file_path in enumerate(file_paths):
- if progress_callback:
- progress_callback(f"Processing file {i+1}/{len(file_paths)}: {Path(file_path).name}")
+ # Parsing is CPU-bound, so files are loaded in worker processes; frames keep the input order
+ with ProcessPoolExecutor(max_workers=max(1, min(os.cpu_count() or 1, total))) as executor:
+ future_to_index = {executor.submit(_load_one, file_path): i for i, file_path in enumerate(file_paths)}
  
+ for done, future in enumerate(as_completed(future_to_index), 1):
+ file_path = file_paths[future_to_index[future]]
  try:
- # Read and standardize file
- df = self.read_file(file_path)
- df = self.standardize_columns(df)
- df['source_file'] = str(Path(file_path).name)
- 
- # Classify access types
- df['access'] = df.apply(self.classify_tool_access, axis=1)
- 
- all_data.append(df)
+ frames[future_to_index[future]] = future.result()
+ if progress_callback:
+ progress_callback(f"Processed file {done}/{total}: {Path(file_path).name}")
  
  except Exception as e:
  if progress_callback:
  progress_callback(f"Error processing {file_path}: {str(e)}")
  continue
  
+ all_data = [df for df in frames if df is not None]
+ 
  if not all_data:
  raise Exception("No files were successfully processed")
  
@@ -269,7 +520,9 @@ class DataProcessor:
  if progress_callback:
  progress_callback("Removing duplicate entries...")
  
- master_df = master_df.drop_duplicates(subset=['url'], keep='first')
+ # Same key as normalize_url: case, fragment and trailing slash don't make a new link
+ url_key = master_df['url'].astype(str).str.strip().str.lower().str.split('#').str[0].str.rstrip('/')
+ master_df = master_df[~url_key.duplicated(keep='first')].reset_index(drop=True)
  
  # Validate links
  if progress_callback:
@@ -281,7 +534,7 @@ class DataProcessor:
  if progress_callback:
  progress_callback("Saving master CSV...")
  
- master_df.to_csv(self.master_csv, index=False)
+ self.save_master(master_df)
  
  # Create validation report
  validation_df = master_df[['name', 'url', 'link_status', 'link_code', 'link_message', 'source_file']].copy()
@@ -291,10 +544,64 @@ class DataProcessor:
  progress_callback(f"Processing complete! Master CSV saved with {len(master_df)} entries.")
  
  return master_df, len(all_data)
+ 
+ def save_master(self, df):
+ """Write the master CSV and, with pyarrow, a Parquet copy that loads much faster"""
+ if pa is not None:
+ try:
+ table = pa.Table.from_pandas(df, preserve_index=False)
+ except (pa.ArrowInvalid, pa.ArrowTypeError):
+ table = None # columns mixing value types: pandas writes the CSV
+ if table is not None:
+ pacsv.write_csv(table, str(self.master_csv))
+ pq.write_table(table, str(self.master_parquet))
+ return
+ df.to_csv(self.master_csv, index=False)
+ 
+ def save_link_status(self, df):
+ """
+ Persist revalidated link columns. The master CSV is the record other tools read,
+ so it is rewritten together with its Parquet copy rather than patched on the side.
+ """
+ self.save_master(df)
+ 
+ def load_master(self):
+ """Read the master data, from the Parquet copy when it is at least as new as the CSV"""
+ if not self._parquet_is_current():
+ return pd.read_csv(self.master_csv)
+ 
+ return pd.read_parquet(self.master_parquet)
+ 
+ def _parquet_is_current(self):
+ """Whether the Parquet copy holds the latest master data"""
+ return (pa is not None and self.master_parquet.exists()
+ and self.master_parquet.stat().st_mtime_ns >= self.master_csv.stat().st_mtime_ns)
+
+def _load_one(file_path):
+ """Read, standardize and classify one input file (runs in a worker process)"""
+ processor = DataProcessor()
+ df = processor.read_file(file_path)
+ df = processor.standardize_columns(df)
+ df['source_file'] = str(Path(file_path).name)
+ 
+ # Classify access types
+ df['access'] = processor.classify_tool_access(df)
+ 
+ return df
+
+def _column_values(df, columns):
+ """One object array per column, '' where the column or a value is missing"""
+ empty = np.full(len(df), '', dtype=object)
+ return [df[col].to_numpy(dtype=object, na_value='') if col in df.columns else empty for col in columns]
 
 class BusinessToolsGUI:
  """Enhanced GUI for the Business Tools Browser"""
  
+ # Data fields shown in the data browser, in Treeview column order
+ TREE_FIELDS = ['name', 'description', 'url', 'category', 'access', 'link_status', 'source_file']
+ # Data fields the filter box searches
+ FILTER_FIELDS = ['name', 'description', 'category', 'url']
+ 
  def __init__(self):
  self.root = tk.Tk()
  self.root.title("Business Tools Browser - Enhanced")
@@ -303,11 +610,27 @@ class BusinessToolsGUI:
  self.processor = DataProcessor()
  self.current_data = None
  
+ # Data browser viewport: only the rows in view exist as Treeview items
+ self._display_columns = _column_values(pd.DataFrame(columns=self.TREE_FIELDS), self.TREE_FIELDS)
+ self._view_first = 0
+ self._view_size = 20
+ 
+ # Display copy of current_data for the data tree, its lowercased filter fields,
+ # and the pending debounced filter
+ self._tree_data = None
+ self._lc = {}
+ self._filter_after_id = None
+ 
+ # Progress messages and UI calls posted by worker threads, applied on the Tk thread
+ self._msg_q = Queue()
+ 
  self.setup_gui()
  self.load_existing_data()
  
  def setup_gui(self):
  """Setup the GUI interface"""
+ self.root.after(50, self._drain)
+ 
  # Create main notebook for tabs
  self.notebook = ttk.Notebook(self.root)
  self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -376,7 +699,7 @@ class BusinessToolsGUI:
  self.filter_var = tk.StringVar()
  self.filter_entry = ttk.Entry(controls_frame, textvariable=self.filter_var)
  self.filter_entry.pack(side=tk.LEFT, padx=5)
- self.filter_entry.bind('<KeyRelease>', self.apply_filter)
+ self.filter_entry.bind('<KeyRelease>', self._schedule_filter)
  
  # Data display
  data_frame = ttk.Frame(self.browser_frame)
@@ -390,18 +713,28 @@ class BusinessToolsGUI:
  self.tree.heading(col, text=col, anchor=tk.W)
  self.tree.column(col, width=150, anchor=tk.W)
  
- # Scrollbars for treeview
- v_scrollbar = ttk.Scrollbar(data_frame, orient=tk.VERTICAL, command=self.tree.yview)
+ # Scrollbars for treeview; the vertical one moves the viewport over the displayed rows
+ self.tree_scrollbar = ttk.Scrollbar(data_frame, orient=tk.VERTICAL, command=self._on_tree_scroll)
  h_scrollbar = ttk.Scrollbar(data_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
- self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+ self.tree.configure(xscrollcommand=h_scrollbar.set)
  
  self.tree.grid(row=0, column=0, sticky='nsew')
- v_scrollbar.grid(row=0, column=1, sticky='ns')
+ self.tree_scrollbar.grid(row=0, column=1, sticky='ns')
  h_scrollbar.grid(row=1, column=0, sticky='ew')
  
  data_frame.grid_rowconfigure(0, weight=1)
  data_frame.grid_columnconfigure(0, weight=1)
  
+ # Keep the viewport sized to the widget and scroll it with the mouse wheel
+ # Set the row height from the Treeview font rather than trusting the theme's default
+ # (often unset, or too small with large fonts/HiDPI), so the viewport row count is exact
+ self._row_height = tkfont.nametofont('TkDefaultFont').metrics('linespace') + 6
+ ttk.Style(self.root).configure('Treeview', rowheight=self._row_height)
+ self.tree.bind('<Configure>', self._on_tree_resize)
+ self.tree.bind('<MouseWheel>', self._on_tree_wheel)
+ self.tree.bind('<Button-4>', self._on_tree_wheel)
+ self.tree.bind('<Button-5>', self._on_tree_wheel)
+ 
  # Double-click to open URL
  self.tree.bind('<Double-1>', self.open_url)
  
@@ -469,9 +802,33 @@ class BusinessToolsGUI:
  self.files_listbox.insert(tk.END, Path(file_path).name)
  
  def update_progress(self, message):
- """Update progress display"""
+ """Update progress display (safe to call from worker threads)"""
+ self._msg_q.put(message)
+ 
+ def call_in_ui(self, func, *args):
+ """Run func(*args) on the Tk thread (for worker threads)"""
+ self._msg_q.put((func, args))
+ 
+ def _drain(self):
+ """Apply queued progress messages and UI calls, showing only the latest message of a burst"""
+ message = None
+ try:
+ for _ in range(500):
+ item = self._msg_q.get_nowait()
+ if isinstance(item, str):
+ message = item
+ continue
+ if message is not None:
+ self.progress_var.set(message)
+ message = None
+ func, args = item
+ func(*args)
+ except Empty:
+ pass
+ finally:
+ if message is not None:
  self.progress_var.set(message)
- self.root.update()
+ self.root.after(50, self._drain)
  
  def process_files(self):
  """Process selected files in background thread"""
@@ -481,7 +838,7 @@ class BusinessToolsGUI:
  
  def process_thread():
  try:
- self.progress_bar.start()
+ self.call_in_ui(self.progress_bar.start)
  self.update_progress("Starting file processing...")
  
  master_df, file_count = self.processor.process_files(
@@ -489,21 +846,21 @@ class BusinessToolsGUI:
  self.update_progress
  )
  
- self.progress_bar.stop()
+ self.call_in_ui(self.progress_bar.stop)
  self.update_progress(f"Completed! Processed {file_count} files, {len(master_df)} total entries.")
  
  # Load the new data
- self.load_existing_data()
+ self.call_in_ui(self.load_existing_data)
  
- messagebox.showinfo("Success", 
+ self.call_in_ui(messagebox.showinfo, "Success", 
  f"Successfully processed {file_count} files!\n"
  f"Total entries: {len(master_df)}\n"
  f"Master CSV saved to: {self.processor.master_csv}")
  
  except Exception as e:
- self.progress_bar.stop()
+ self.call_in_ui(self.progress_bar.stop)
  self.update_progress(f"Error: {str(e)}")
- messagebox.showerror("Error", f"Processing failed: {str(e)}")
+ self.call_in_ui(messagebox.showerror, "Error", f"Processing failed: {str(e)}")
  
  threading.Thread(target=process_thread, daemon=True).start()
  
@@ -511,7 +868,9 @@ class BusinessToolsGUI:
  """Load existing master CSV data"""
  if self.processor.master_csv.exists():
  try:
- self.current_data = pd.read_csv(self.processor.master_csv)
+ self.current_data = self.processor.load_master()
+ self._lc = {col: self.current_data[col].fillna('').astype(str).str.lower()
+ for col in self.FILTER_FIELDS if col in self.current_data.columns}
  self.populate_tree()
  self.populate_validation_tree()
  self.update_validation_stats()
@@ -523,23 +882,54 @@ class BusinessToolsGUI:
  if self.current_data is None:
  return
  
- # Clear existing data
- for item in self.tree.get_children():
- self.tree.delete(item)
- 
- # Add data rows
- for _, row in self.current_data.iterrows():
- values = [
- row.get('name', ''),
- row.get('description', '')[:50] + '...' if len(str(row.get('description', ''))) > 50 else row.get('description', ''),
- row.get('url', ''),
- row.get('category', ''),
- row.get('access', ''),
- row.get('link_status', ''),
- row.get('source_file', '')
- ]
+ # Display copy of the shown fields, with descriptions shortened once for all rows
+ self._tree_data = self.current_data.reindex(columns=self.TREE_FIELDS)
+ description = self._tree_data['description'].fillna('').astype(str)
+ self._tree_data['description'] = np.where(description.str.len() > 50,
+ description.str.slice(0, 50) + '...', description)
+ self.show_rows(self._tree_data)
+ 
+ def show_rows(self, df):
+ """Display the rows of df in the data tree, starting from the top"""
+ self._display_columns = _column_values(df, self.TREE_FIELDS)
+ self._refresh_tree(0)
+ 
+ def _refresh_tree(self, first):
+ """Render only the rows currently in view into the data tree"""
+ total = len(self._display_columns[0])
+ first = max(0, min(first, total - self._view_size))
+ last = min(first + self._view_size, total)
+ self._view_first = first
+ 
+ self.tree.delete(*self.tree.get_children())
+ for values in zip(*[column[first:last] for column in self._display_columns]):
  self.tree.insert('', 'end', values=values)
  
+ if total:
+ self.tree_scrollbar.set(first / total, last / total)
+ else:
+ self.tree_scrollbar.set(0, 1)
+ 
+ def _on_tree_scroll(self, action, amount, unit=None):
+ """Vertical scrollbar command for the data tree viewport"""
+ if action == 'moveto':
+ first = int(float(amount) * len(self._display_columns[0]))
+ else:
+ step = self._view_size if unit == 'pages' else 1
+ first = self._view_first + int(amount) * step
+ self._refresh_tree(first)
+ 
+ def _on_tree_wheel(self, event):
+ """Scroll the data tree viewport with the mouse wheel"""
+ up = event.num == 4 or event.delta > 0
+ self._refresh_tree(self._view_first + (-3 if up else 3))
+ return 'break'
+ 
+ def _on_tree_resize(self, event):
+ """Fit the viewport to the rows the widget can show (less the heading row)"""
+ self._view_size = max(1, event.height // self._row_height - 1)
+ self._refresh_tree(self._view_first)
+ 
  def populate_validation_tree(self):
  """Populate the validation results tree"""
  if self.current_data is None:
@@ -550,15 +940,8 @@ class BusinessToolsGUI:
  self.val_tree.delete(item)
  
  # Add validation data
- for _, row in self.current_data.iterrows():
- values = [
- row.get('name', ''),
- row.get('url', ''),
- row.get('link_status', ''),
- row.get('link_code', ''),
- row.get('link_message', ''),
- row.get('source_file', '')
- ]
+ columns = _column_values(self.current_data, ['name', 'url', 'link_status', 'link_code', 'link_message', 'source_file'])
+ for values in zip(*columns):
  self.val_tree.insert('', 'end', values=values)
  
  def update_validation_stats(self):
@@ -579,42 +962,31 @@ class BusinessToolsGUI:
  self.stats_text.delete('1.0', tk.END)
  self.stats_text.insert('1.0', stats_text)
  
+ def _schedule_filter(self, event=None):
+ """Apply the filter once typing pauses, not on every key release"""
+ if self._filter_after_id is not None:
+ self.root.after_cancel(self._filter_after_id)
+ self._filter_after_id = self.root.after(150, self.apply_filter)
+ 
  def apply_filter(self, event=None):
  """Apply filter to the data display"""
+ self._filter_after_id = None
  if self.current_data is None:
  return
  
  filter_text = self.filter_var.get().lower()
  
- # Clear tree
- for item in self.tree.get_children():
- self.tree.delete(item)
- 
  # Filter and populate
- if filter_text:
- filtered_data = self.current_data[
- self.current_data.apply(
- lambda row: filter_text in str(row.get('name', '')).lower() or
- filter_text in str(row.get('description', '')).lower() or
- filter_text in str(row.get('category', '')).lower() or
- filter_text in str(row.get('url', '')).lower(),
- axis=1
- )
- ]
+ if filter_text and self._lc:
+ mask = np.logical_or.reduce([lc.str.contains(filter_text, regex=False).to_numpy(dtype=bool)
+ for lc in self._lc.values()])
+ filtered_data = self._tree_data[mask]
+ elif filter_text:
+ filtered_data = self._tree_data.iloc[:0]
  else:
- filtered_data = self.current_data
- 
- for _, row in filtered_data.iterrows():
- values = [
- row.get('name', ''),
- row.get('description', '')[:50] + '...' if len(str(row.get('description', ''))) > 50 else row.get('description', ''),
- row.get('url', ''),
- row.get('category', ''),
- row.get('access', ''),
- row.get('link_status', ''),
- row.get('source_file', '')
- ]
- self.tree.insert('', 'end', values=values)
+ filtered_data = self._tree_data
+ 
+ self.show_rows(filtered_data)
  
  def open_url(self, event):
  """Open URL in browser when double-clicked"""
@@ -634,7 +1006,7 @@ class BusinessToolsGUI:
  
  def revalidate_thread():
  try:
- self.progress_bar.start()
+ self.call_in_ui(self.progress_bar.start)
  self.update_progress("Re-validating all links...")
  
  self.current_data = self.processor.validate_links_with_progress(
@@ -643,22 +1015,22 @@ class BusinessToolsGUI:
  )
  
  # Save updated data
- self.current_data.to_csv(self.processor.master_csv, index=False)
+ self.processor.save_link_status(self.current_data)
  
- self.progress_bar.stop()
+ self.call_in_ui(self.progress_bar.stop)
  self.update_progress("Link validation completed!")
  
  # Refresh displays
- self.populate_tree()
- self.populate_validation_tree()
- self.update_validation_stats()
+ self.call_in_ui(self.populate_tree)
+ self.call_in_ui(self.populate_validation_tree)
+ self.call_in_ui(self.update_validation_stats)
  
- messagebox.showinfo("Success", "Link validation completed!")
+ self.call_in_ui(messagebox.showinfo, "Success", "Link validation completed!")
  
  except Exception as e:
- self.progress_bar.stop()
+ self.call_in_ui(self.progress_bar.stop)
  self.update_progress(f"Error: {str(e)}")
- messagebox.showerror("Error", f"Validation failed: {str(e)}")
+ self.call_in_ui(messagebox.showerror, "Error", f"Validation failed: {str(e)}")
  
  threading.Thread(target=revalidate_thread, daemon=True).start()
  
@@ -718,13 +1090,13 @@ def main():
  print("Validating links in existing master CSV...")
  try:
  if processor.master_csv.exists():
- df = pd.read_csv(processor.master_csv)
+ df = processor.load_master()
  
  def progress_callback(message):
  print(f"Progress: {message}")
  
  df = processor.validate_links_with_progress(df, progress_callback)
- df.to_csv(processor.master_csv, index=False)
+ processor.save_link_status(df)
  
  # Update validation report
  validation_df = df[['name', 'url', 'link_status', 'link_code', 'link_message', 'source_file']].copy()
@@ -8,11 +8,50 @@ No emojis, relative paths, generic Excel file support
 import sys
 import os
 import argparse
+import asyncio
+import importlib.util
+import json
+import re
+import time
+import numpy as np
 import pandas as pd
+
+try:
+ import pyarrow as pa
+except ImportError:
+ pa = None
+
+try:
+ # Optional: URL checks multiplexed on one asyncio event loop
+ import httpx
+except ImportError:
+ httpx = None
+
+try:
+ # Optional: Aho-Corasick keyword automata (pyahocorasick) for classification
+ import ahocorasick
+except ImportError:
+ ahocorasick = None
+
+try:
+ # Optional: fused JIT classification kernel
+ from numba import njit
+except ImportError:
+ njit = None
+
+# HTTP/2 in httpx needs the h2 package
+HTTP2 = importlib.util.find_spec('h2') is not None
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from queue import Queue, Empty
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from tkinter import font as tkfont
 import webbrowser
 from pathlib import Path
 import glob
@@ -25,6 +64,9 @@ RESOURCES_DIR = APP_DIR / "resources"
 # Ensure data directory exists
 DATA_DIR.mkdir(exist_ok=True)
 
+# URL check results older than this are probed again
+URL_CACHE_TTL = 7 * 24 * 3600
+
 def find_excel_file():
  """Find the first Excel file in the current directory or data subdirectory"""
  # Check data subdirectory first
@@ -43,99 +85,333 @@ def find_excel_file():
  
  return None
 
+# Low-cardinality columns of the cleaned data, kept as pandas categoricals
+CLEANED_DTYPES = {"Category": "category", "Access_Level": "category"}
+
+# Display names for well-known tools
+NAME_MAP = {
+ "Draw.io": "Draw.io - Web Diagramming Tool",
+ "Doitlive": "Doitlive - Terminal Demo Simulator",
+ "Skype": "Skype - Web-Based Video & Voice Communication",
+ "Trello": "Trello - Visual Project Management Boards",
+ "Lucidchart": "Lucidchart - Intelligent Diagramming Platform",
+ "Jupyterlab": "JupyterLab - Interactive Data Science Environment"
+}
+
+# Keyword rules for the derived columns - checked in order, first match wins
+DESCRIPTION_RULES = [
+ (("diagram",), "Tool for creating flowcharts, architecture maps, and process diagrams."),
+ (("learning", "labs"), "Interactive learning tools and environments for business technologies."),
+ (("authentic", "token"), "Authentication and identity tools for secure access control."),
+ (("stream", "video"), "Utilities for recording, streaming, and multimedia editing."),
+ (("terminal",), "CLI tools for sysadmin workflows and shell automation."),
+ (("git",), "Repositories or tools for managing source code and collaboration."),
+]
+
+CATEGORY_RULES = [
+ (("authentication", "token"), "Security"),
+ (("learning", "labs", "training"), "Education"),
+ (("diagram",), "Diagramming"),
+ (("stream", "video", "recording"), "Media Tools"),
+ (("git", "repository"), "Code Repositories"),
+ (("meeting", "conference"), "Meetings"),
+ (("automation", "ansible"), "Automation"),
+ (("terminal",), "CLI Utilities"),
+]
+
+INTERNAL_INDICATORS = (
+ 'redhat.com', 'internal', 'intranet', 'corp', 'employee',
+ 'staff', 'private', 'restricted', 'confidential'
+)
+
+def _lower_text(series):
+ """Lowercase a column as text, the way str(value).lower() would per row"""
+ return series.astype(str).str.lower()
+
+def _keywords_re(keywords):
+ """Compile literal keywords into one alternation, so each text is scanned once"""
+ return re.compile('|'.join(map(re.escape, keywords)))
+
+def _matches(text, pattern):
+ """Boolean array - True where text contains a match for pattern"""
+ return text.str.contains(pattern, na=False).to_numpy()
+
+def _keywords_automaton(keyword_groups):
+ """Aho-Corasick automaton over all keyword groups; each keyword's payload is its group index"""
+ automaton = ahocorasick.Automaton()
+ for index, keywords in enumerate(keyword_groups):
+ for keyword in keywords:
+ if not automaton.exists(keyword):
+ automaton.add_word(keyword, index)
+ automaton.make_automaton()
+ return automaton
+
+def _first_group(text, automaton):
+ """Lowest keyword group index found in each text (one pass per text), -1 where none is"""
+ return np.fromiter((min((group for _, group in automaton.iter(value)), default=-1)
+ for value in text.fillna('')), dtype=np.intp, count=len(text))
+
+def _select_rules(text, rules, default, automaton=None):
+ """Label each row with the first (pattern, label) rule it matches"""
+ if automaton is not None:
+ first = _first_group(text, automaton)
+ conditions = [first == index for index in range(len(rules))]
+ else:
+ conditions = [_matches(text, pattern) for pattern, _ in rules]
+ choices = [np.full(len(text), label, dtype=object) for _, label in rules]
+ return np.select(conditions, choices, default=default)
+
+def _synopsis_column(df):
+ """Column the tool descriptions are read from, or None"""
+ return 'Synopsis' if 'Synopsis' in df.columns else 'Description' if 'Description' in df.columns else None
+
+def _pack_text(texts):
+ """UTF-8 encode texts into one byte buffer plus start offsets (len(texts) + 1 of them)"""
+ encoded = [text.encode('utf-8') for text in texts]
+ offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+ np.cumsum([len(text) for text in encoded], out=offsets[1:])
+ return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+def _pack_keywords(keyword_groups):
+ """Packed keywords plus the group index of each one, as the kernel reads them"""
+ keywords = [keyword for keywords in keyword_groups for keyword in keywords]
+ groups = [index for index, keywords in enumerate(keyword_groups) for _ in keywords]
+ return _pack_text(keywords) + (np.array(groups, dtype=np.int64),)
+
+if njit is not None:
+ @njit(cache=True)
+ def _kernel_first_group(buf, start, end, keywords):
+ """Lowest group index of a keyword found in buf[start:end], -1 if none is"""
+ kw_buf, kw_offsets, kw_groups = keywords
+ best = -1
+ for k in range(len(kw_groups)):
+ group = kw_groups[k]
+ if best >= 0 and group >= best:
+ continue
+ ks = kw_offsets[k]
+ kl = kw_offsets[k + 1] - ks
+ for i in range(start, end - kl + 1):
+ j = 0
+ while j < kl and buf[i + j] == kw_buf[ks + j]:
+ j += 1
+ if j == kl:
+ best = group
+ break
+ return best
+ 
+ @njit(cache=True)
+ def _classify_kernel(syn_buf, syn_offsets, url_buf, url_offsets,
+ description_kw, category_kw, internal_kw, canned_category, canned_internal):
+ """One pass over the packed text: description rule, category rule and internal flag per row"""
+ n = len(syn_offsets) - 1
+ description_codes = np.empty(n, dtype=np.int8)
+ category_codes = np.empty(n, dtype=np.int8)
+ internal = np.empty(n, dtype=np.bool_)
+ for i in range(n):
+ start, end = syn_offsets[i], syn_offsets[i + 1]
+ code = _kernel_first_group(syn_buf, start, end, description_kw)
+ description_codes[i] = code
+ if code >= 0:
+ # The canned description replaces the text; its category and flag are precomputed
+ category_codes[i] = canned_category[code]
+ hit = canned_internal[code]
+ else:
+ category_codes[i] = _kernel_first_group(syn_buf, start, end, category_kw)
+ hit = _kernel_first_group(syn_buf, start, end, internal_kw) >= 0
+ internal[i] = hit or _kernel_first_group(url_buf, url_offsets[i], url_offsets[i + 1], internal_kw) >= 0
+ return description_codes, category_codes, internal
+
+def _level_counts(df):
+ """Tools per Category and per Access_Level, plus the sorted labels of each"""
+ cat_counts = df['Category'].value_counts()
+ acc_counts = df['Access_Level'].value_counts()
+ return cat_counts, acc_counts, sorted(cat_counts.index.tolist()), sorted(acc_counts.index.tolist())
+
+def _column_values(df, column, default):
+ """Values of a column as an array, or the default repeated when it is missing"""
+ if column in df.columns:
+ return df[column].to_numpy()
+ return np.full(len(df), default, dtype=object)
+
 class DataProcessor:
  """Handles Excel/CSV data processing and cleaning"""
  
- def __init__(self):
+ def __init__(self, check_urls=True):
  self.source_file = None
+ self.validate_urls = check_urls
  self.cleaned_csv = DATA_DIR / "Cleaned_Tools.csv"
+ self.cleaned_parquet = DATA_DIR / "Cleaned_Tools.parquet"
  self.summary_csv = DATA_DIR / "Tools_Summary.csv"
  
- def classify_tool_access(self, row):
- """Classify tool as Internal or Public based on URL and description"""
- url = str(row.get('URL', '')).lower()
- synopsis = str(row.get('Enhanced_Synopsis', '')).lower()
- 
- # Internal indicators
- internal_indicators = [
- 'redhat.com', 'internal', 'intranet', 'corp', 'employee',
- 'staff', 'private', 'restricted', 'confidential'
- ]
- 
- # Check URL and description
- for indicator in internal_indicators:
- if indicator in url or indicator in synopsis:
- return 'Internal'
+ # Persistent URL check results: {url: [status, checked_at]}
+ self.url_cache_file = DATA_DIR / "url_status.json"
+ try:
+ with open(self.url_cache_file) as f:
+ self._url_cache = json.load(f)
+ except (OSError, ValueError):
+ self._url_cache = {}
+ 
+ # Shared keep-alive session for URL checks from the worker threads
+ self.session = requests.Session()
+ adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=Retry(total=1))
+ self.session.mount('http://', adapter)
+ self.session.mount('https://', adapter)
+ 
+ # Keyword rules compiled once into (pattern, label) pairs
+ self._description_rules = [(_keywords_re(keywords), label) for keywords, label in DESCRIPTION_RULES]
+ self._category_rules = [(_keywords_re(keywords), label) for keywords, label in CATEGORY_RULES]
+ self._internal_re = _keywords_re(INTERNAL_INDICATORS)
+ 
+ # With pyahocorasick, one automaton per rule set finds all of its keywords in a single scan
+ self._description_automaton = self._category_automaton = self._internal_automaton = None
+ if ahocorasick is not None:
+ self._description_automaton = _keywords_automaton([keywords for keywords, _ in DESCRIPTION_RULES])
+ self._category_automaton = _keywords_automaton([keywords for keywords, _ in CATEGORY_RULES])
+ self._internal_automaton = _keywords_automaton([INTERNAL_INDICATORS])
+ 
+ # With numba, the packed keyword tables and label lookups for the fused kernel
+ if njit is not None:
+ self._fused_keywords = (_pack_keywords([keywords for keywords, _ in DESCRIPTION_RULES]),
+ _pack_keywords([keywords for keywords, _ in CATEGORY_RULES]),
+ _pack_keywords([INTERNAL_INDICATORS]))
+ canned = pd.Series([label for _, label in DESCRIPTION_RULES]).str.lower()
+ self._fused_canned = (
+ np.array([self._rule_index(text, self._category_rules) for text in canned], dtype=np.int8),
+ self._has_internal_indicator(canned)
+ )
+ self._description_labels = np.array([label for _, label in DESCRIPTION_RULES], dtype=object)
+ # Code -1 (no rule matched) indexes the trailing default
+ self._category_labels = np.array([label for _, label in CATEGORY_RULES] + ["General Utilities"], dtype=object)
+ 
+ @staticmethod
+ def _rule_index(text, rules):
+ """Index of the first (pattern, label) rule matching text, -1 if none does"""
+ return next((index for index, (pattern, _) in enumerate(rules) if pattern.search(text)), -1)
+ 
+ def _has_internal_indicator(self, text):
+ """Boolean array - True where the lowercased text contains an internal indicator"""
+ if self._internal_automaton is not None:
+ return _first_group(text, self._internal_automaton) >= 0
+ return _matches(text, self._internal_re)
+ 
+ def classify_tool_access(self, df, synopsis_lc=None):
+ """Classify tools as Internal or Public based on URL and description
+ 
+ synopsis_lc may pass in the already lowercased Enhanced_Synopsis column.
+ """
+ internal = np.zeros(len(df), dtype=bool)
+ if 'URL' in df.columns:
+ internal |= self._has_internal_indicator(_lower_text(df['URL']))
+ if synopsis_lc is None and 'Enhanced_Synopsis' in df.columns:
+ synopsis_lc = _lower_text(df['Enhanced_Synopsis'])
+ if synopsis_lc is not None:
+ internal |= self._has_internal_indicator(synopsis_lc)
  
- return 'Public'
+ return np.where(internal, 'Internal', 'Public')
  
  def enhance_name(self, name):
  """Enhance tool names with descriptions"""
- name_map = {
- "Draw.io": "Draw.io - Web Diagramming Tool",
- "Doitlive": "Doitlive - Terminal Demo Simulator",
- "Skype": "Skype - Web-Based Video & Voice Communication",
- "Trello": "Trello - Visual Project Management Boards",
- "Lucidchart": "Lucidchart - Intelligent Diagramming Platform",
- "Jupyterlab": "JupyterLab - Interactive Data Science Environment"
- }
- return name_map.get(name, name)
+ return NAME_MAP.get(name, name)
  
- def enhance_description(self, row, df):
+ def enhance_description(self, df):
  """Enhance tool descriptions"""
- synopsis_col = 'Synopsis' if 'Synopsis' in df.columns else 'Description' if 'Description' in df.columns else None
+ synopsis_col = _synopsis_column(df)
  if synopsis_col is None:
- return "Tool description not available"
- 
- synopsis = str(row[synopsis_col]).lower()
- if "diagram" in synopsis:
- return "Tool for creating flowcharts, architecture maps, and process diagrams."
- elif "learning" in synopsis or "labs" in synopsis:
- return "Interactive learning tools and environments for business technologies."
- elif "authentic" in synopsis or "token" in synopsis:
- return "Authentication and identity tools for secure access control."
- elif "stream" in synopsis or "video" in synopsis:
- return "Utilities for recording, streaming, and multimedia editing."
- elif "terminal" in synopsis:
- return "CLI tools for sysadmin workflows and shell automation."
- elif "git" in synopsis:
- return "Repositories or tools for managing source code and collaboration."
- return row[synopsis_col] if synopsis_col in row else "Tool description not available"
- 
- def categorize(self, row):
- """Categorize tools based on description"""
- desc = str(row["Enhanced_Synopsis"]).lower()
- if "authentication" in desc or "token" in desc:
- return "Security"
- elif "learning" in desc or "labs" in desc or "training" in desc:
- return "Education"
- elif "diagram" in desc:
- return "Diagramming"
- elif "stream" in desc or "video" in desc or "recording" in desc:
- return "Media Tools"
- elif "git" in desc or "repository" in desc:
- return "Code Repositories"
- elif "meeting" in desc or "conference" in desc:
- return "Meetings"
- elif "automation" in desc or "ansible" in desc:
- return "Automation"
- elif "terminal" in desc:
- return "CLI Utilities"
- return "General Utilities"
+ return np.full(len(df), "Tool description not available", dtype=object)
+ 
+ original = df[synopsis_col].to_numpy(dtype=object)
+ return _select_rules(_lower_text(df[synopsis_col]), self._description_rules, original,
+ self._description_automaton)
+ 
+ def categorize(self, df, synopsis_lc=None):
+ """Categorize tools based on description (optionally the already lowercased column)"""
+ if synopsis_lc is None:
+ synopsis_lc = _lower_text(df["Enhanced_Synopsis"])
+ return _select_rules(synopsis_lc, self._category_rules, "General Utilities",
+ self._category_automaton)
+ 
+ def classify_fused(self, df, synopsis_col):
+ """Enhanced_Synopsis, Category and Access_Level from one compiled pass (needs numba)"""
+ synopsis = df[synopsis_col]
+ urls = _lower_text(df['URL']).fillna('') if 'URL' in df.columns else pd.Series('', index=df.index)
+ description_codes, category_codes, internal = _classify_kernel(
+ *_pack_text(_lower_text(synopsis).fillna('').tolist()), *_pack_text(urls.tolist()),
+ *self._fused_keywords, *self._fused_canned)
+ 
+ enhanced = np.where(description_codes >= 0, self._description_labels[description_codes],
+ synopsis.to_numpy(dtype=object))
+ return enhanced, self._category_labels[category_codes], np.where(internal, 'Internal', 'Public')
  
  def check_url(self, url):
  """Check URL accessibility"""
  try:
- response = requests.head(url, allow_redirects=True, timeout=6)
- if response.status_code == 200:
+ response = self.session.head(url, allow_redirects=True, timeout=6)
+ return self.url_status(response.status_code)
+ except:
+ return "Invalid"
+ 
+ @staticmethod
+ def url_status(status_code):
+ """Status label for an HTTP response code"""
+ if status_code == 200:
  return "OK"
- elif response.status_code == 403:
+ elif status_code == 403:
  return "Restricted"
  else:
- return f"Error {response.status_code}"
- except:
+ return f"Error {status_code}"
+ 
+ def check_urls(self, urls):
+ """Check URLs concurrently; returns their status labels in order"""
+ if httpx is not None:
+ return asyncio.run(self._check_all(urls))
+ 
+ with ThreadPoolExecutor(max_workers=32) as executor:
+ return list(executor.map(self.check_url, urls))
+ 
+ def cached_url_status(self, urls):
+ """Status of each URL, probing only those missing from the cache or older than URL_CACHE_TTL"""
+ now = time.time()
+ status = {}
+ for url in urls:
+ entry = self._url_cache.get(url)
+ if entry and now - entry[1] < URL_CACHE_TTL:
+ status[url] = entry[0]
+ 
+ stale = [url for url in urls if url not in status]
+ if stale:
+ for url, result in zip(stale, self.check_urls(stale)):
+ status[url] = result
+ # "Invalid" means no HTTP response (timeout, connection error) - retry it next run
+ if result != "Invalid":
+ self._url_cache[url] = [result, now]
+ self.save_url_cache()
+ return status
+ 
+ def save_url_cache(self):
+ """Write the URL check results (atomically, so a crash can't truncate them)"""
+ tmp_file = self.url_cache_file.with_suffix(f".{os.getpid()}.tmp")
+ with open(tmp_file, 'w') as f:
+ json.dump(self._url_cache, f)
+ os.replace(tmp_file, self.url_cache_file)
+ 
+ async def _check_url_async(self, client, url, slots):
+ """Check URL accessibility on the event loop (same labels as check_url)"""
+ try:
+ # Wait for a free slot here, so the 6 s timeout never counts time queued for the pool
+ async with slots:
+ response = await client.head(url)
+ return self.url_status(response.status_code)
+ except Exception:
  return "Invalid"
  
+ async def _check_all(self, urls, max_connections=100):
+ """Check every URL over one shared httpx client, at most max_connections at a time"""
+ limits = httpx.Limits(max_connections=max_connections)
+ slots = asyncio.Semaphore(max_connections)
+ async with httpx.AsyncClient(http2=HTTP2, limits=limits, timeout=6,
+ follow_redirects=True) as client:
+ return await asyncio.gather(*(self._check_url_async(client, url, slots) for url in urls))
+ 
  def process_excel_file(self, file_path, progress_callback=None):
  """Process Excel file and create cleaned CSV"""
  try:
@@ -146,18 +422,18 @@ class DataProcessor:
  if file_path.endswith('.csv'):
  df = pd.read_csv(file_path)
  else:
- xls_dict = pd.read_excel(file_path, sheet_name=None)
- if len(xls_dict) == 1:
- df = list(xls_dict.values())[0]
- else:
- sheet_names = list(xls_dict.keys())
- df = xls_dict[sheet_names[0]]
+ # Only the first sheet is used - read just that one, with the Rust
+ # calamine reader when python-calamine is installed
+ try:
+ df = pd.read_excel(file_path, sheet_name=0, engine='calamine')
+ except ImportError:
+ df = pd.read_excel(file_path, sheet_name=0)
  
  if progress_callback:
  progress_callback("Cleaning column names...")
  
  # Fix column names
- df.columns = [col.strip().title().replace(" ", "_") for col in df.columns]
+ df.columns = df.columns.str.strip().str.title().str.replace(" ", "_", regex=False)
  
  # Map common column variations
  column_mapping = {
@@ -172,17 +448,23 @@ class DataProcessor:
  'Category': 'Tool_Type'
  }
  
+ # The first variation present wins each target, and existing targets are kept
+ renames = {}
  for old_name, new_name in column_mapping.items():
- if old_name in df.columns and new_name not in df.columns:
- df.rename(columns={old_name: new_name}, inplace=True)
- 
- if progress_callback:
- progress_callback("Validating URLs...")
+ if old_name in df.columns and new_name not in df.columns and new_name not in renames.values():
+ renames[old_name] = new_name
+ df = df.rename(columns=renames)
  
  # Validate URLs if column exists
  if 'URL' in df.columns:
  df["URL"] = df["URL"].astype(str).str.strip()
- df["URL_Status"] = df["URL"].apply(self.check_url)
+ if self.validate_urls:
+ if progress_callback:
+ progress_callback("Validating URLs...")
+ 
+ # Probe each distinct URL once and fan the status back out to every row
+ status = self.cached_url_status(df["URL"].unique())
+ df["URL_Status"] = df["URL"].map(status)
  df = df[df["URL_Status"] == "OK"]
  
  if progress_callback:
@@ -190,17 +472,30 @@ class DataProcessor:
  
  # Enhance names and descriptions
  if 'Name' in df.columns:
- df["Name"] = df["Name"].apply(self.enhance_name)
- 
- df["Enhanced_Synopsis"] = df.apply(lambda row: self.enhance_description(row, df), axis=1)
- df["Category"] = df.apply(self.categorize, axis=1)
- df["Access_Level"] = df.apply(self.classify_tool_access, axis=1)
+ df["Name"] = df["Name"].map(NAME_MAP).fillna(df["Name"])
+ 
+ synopsis_col = _synopsis_column(df)
+ if njit is not None and synopsis_col is not None:
+ enhanced, category, access = self.classify_fused(df, synopsis_col)
+ df["Enhanced_Synopsis"] = enhanced
+ df["Category"] = category
+ df["Access_Level"] = access
+ else:
+ df["Enhanced_Synopsis"] = self.enhance_description(df)
+ # Both classifiers read the same lowercased descriptions - build them once
+ synopsis_lc = _lower_text(df["Enhanced_Synopsis"])
+ df["Category"] = self.categorize(df, synopsis_lc)
+ df["Access_Level"] = self.classify_tool_access(df, synopsis_lc)
+ df = df.astype(CLEANED_DTYPES)
  
  if progress_callback:
  progress_callback("Saving results...")
  
  # Save results
- df.to_csv(self.cleaned_csv, index=False)
+ # Serialize in row chunks through a 1 MiB buffer rather than one giant string
+ with open(self.cleaned_csv, 'w', buffering=1024 * 1024, newline='') as f:
+ df.to_csv(f, index=False, chunksize=50000)
+ self.save_cleaned_parquet(df)
  summary = df["Category"].value_counts().reset_index()
  summary.columns = ["Category", "Tool_Count"]
  summary.to_csv(self.summary_csv, index=False)
@@ -212,12 +507,34 @@ class DataProcessor:
  
  except Exception as e:
  return False, f"Error processing file: {str(e)}"
+ 
+ def save_cleaned_parquet(self, df):
+ """Write the Parquet copy of the cleaned data; the CSV stays authoritative if this fails"""
+ if pa is not None:
+ try:
+ df.to_parquet(self.cleaned_parquet, index=False)
+ return
+ except (pa.ArrowInvalid, pa.ArrowTypeError, OSError):
+ pass
+ # Don't leave a partial or older Parquet copy shadowing the new CSV
+ self.cleaned_parquet.unlink(missing_ok=True)
+ 
+ def load_cleaned(self):
+ """Load the cleaned data, from the Parquet copy when it is at least as new as the CSV"""
+ if self._parquet_is_current():
+ return pd.read_parquet(self.cleaned_parquet)
+ return pd.read_csv(self.cleaned_csv, dtype=CLEANED_DTYPES)
+ 
+ def _parquet_is_current(self):
+ """Whether the Parquet copy holds the latest cleaned data"""
+ return (pa is not None and self.cleaned_parquet.exists()
+ and self.cleaned_parquet.stat().st_mtime_ns >= self.cleaned_csv.stat().st_mtime_ns)
 
 
 class BusinessToolsGUI:
  """GUI interface for Business Tools Browser"""
  
- def __init__(self):
+ def __init__(self, check_urls=True):
  self.root = tk.Tk()
  self.root.title("Business Tools Browser")
  self.root.geometry("1000x700")
@@ -230,12 +547,22 @@ class BusinessToolsGUI:
  except:
  pass
  
- self.processor = DataProcessor()
+ self.processor = DataProcessor(check_urls)
  self.df = None
  self.filtered_df = None
+ self._search_after_id = None
+ 
+ # Tree viewport: only the rows in view exist as Treeview items
+ self._display_columns = ([],) * 4
+ self._view_first = 0
+ self._view_size = 20
+ 
+ # Callbacks from worker threads, run on the Tk thread by _drain
+ self._msg_q = Queue()
  
  self.setup_ui()
  self.load_data()
+ self.root.after(50, self._drain)
  
  def setup_ui(self):
  """Setup the user interface"""
@@ -314,16 +641,26 @@ class BusinessToolsGUI:
  self.tree.column("Access", width=80, minwidth=80)
  self.tree.column("Description", width=400, minwidth=300)
  
- # Scrollbars
- v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+ # Scrollbars - the vertical one moves the viewport over the displayed rows
+ self.v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self._on_tree_scroll)
  h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
- self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+ self.tree.configure(xscrollcommand=h_scrollbar.set)
  
  # Grid layout for tree and scrollbars
  self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
- v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+ self.v_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
  h_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
  
+ # Keep the viewport sized to the widget and scroll it with the mouse wheel
+ # Set the row height from the Treeview font rather than trusting the theme's default
+ # (often unset, or too small with large fonts/HiDPI), so the viewport row count is exact
+ self._row_height = tkfont.nametofont('TkDefaultFont').metrics('linespace') + 6
+ ttk.Style(self.root).configure('Treeview', rowheight=self._row_height)
+ self.tree.bind('<Configure>', self._on_tree_resize)
+ self.tree.bind('<MouseWheel>', self._on_tree_wheel)
+ self.tree.bind('<Button-4>', self._on_tree_wheel)
+ self.tree.bind('<Button-5>', self._on_tree_wheel)
+ 
  # Bind double-click
  self.tree.bind("<Double-1>", self.on_double_click)
  
@@ -338,7 +675,9 @@ class BusinessToolsGUI:
  """Load data from CSV file"""
  try:
  if self.processor.cleaned_csv.exists():
- self.df = pd.read_csv(self.processor.cleaned_csv)
+ self.df = self.processor.load_cleaned()
+ self.add_search_columns()
+ self.count_levels()
  self.populate_tree()
  self.update_filters()
  self.status_var.set(f"Loaded {len(self.df)} tools")
@@ -348,7 +687,9 @@ class BusinessToolsGUI:
  if excel_file:
  success, message = self.processor.process_excel_file(excel_file)
  if success:
- self.df = pd.read_csv(self.processor.cleaned_csv)
+ self.df = self.processor.load_cleaned()
+ self.add_search_columns()
+ self.count_levels()
  self.populate_tree()
  self.update_filters()
  self.status_var.set(f"Loaded {len(self.df)} tools from {excel_file}")
@@ -359,6 +700,12 @@ class BusinessToolsGUI:
  except Exception as e:
  self.status_var.set(f"Error loading data: {str(e)}")
  
+ def add_search_columns(self):
+ """Join and lowercase the searchable columns once so filtering doesn't redo it per keystroke"""
+ # A newline can't be typed into the search box, so matches never span both fields
+ self.df["_search_lc"] = (self.df["Name"].fillna('') + '\n' +
+ self.df["Enhanced_Synopsis"].fillna('')).str.lower()
+ 
  def load_file(self):
  """Load and process an Excel file"""
  file_path = filedialog.askopenfilename(
@@ -378,12 +725,19 @@ class BusinessToolsGUI:
  progress_label.pack(pady=20)
  
  def update_progress(message):
- progress_label.config(text=message)
- progress_window.update()
+ self.call_in_ui(progress_label.config, {'text': message})
+ 
+ # Process file on a worker thread so the window keeps repainting
+ threading.Thread(target=self._run_process, args=(file_path, progress_window, update_progress),
+ daemon=True).start()
  
- # Process file
+ def _run_process(self, file_path, progress_window, update_progress):
+ """Process file_path on a worker thread and hand the result back to the Tk thread"""
  success, message = self.processor.process_excel_file(file_path, update_progress)
+ self.call_in_ui(self._on_process_done, progress_window, success, message)
  
+ def _on_process_done(self, progress_window, success, message):
+ """Close the progress dialog and report the processing result"""
  progress_window.destroy()
  
  if success:
@@ -392,44 +746,105 @@ class BusinessToolsGUI:
  else:
  messagebox.showerror("Error", message)
  
+ def call_in_ui(self, func, *args):
+ """Run func(*args) on the Tk thread (for worker threads)"""
+ self._msg_q.put((func, args))
+ 
+ def _drain(self):
+ """Run the callbacks queued by worker threads"""
+ try:
+ while True:
+ func, args = self._msg_q.get_nowait()
+ func(*args)
+ except Empty:
+ pass
+ finally:
+ self.root.after(50, self._drain)
+ 
  def populate_tree(self):
  """Populate the tree with data"""
- # Clear existing items
- for item in self.tree.get_children():
- self.tree.delete(item)
- 
  if self.df is None:
  return
  
  # Use filtered data if available
  data = self.filtered_df if self.filtered_df is not None else self.df
  
- for _, row in data.iterrows():
- name = row.get('Name', 'Unknown')
- category = row.get('Category', 'Unknown')
- access = row.get('Access_Level', 'Unknown')
- description = row.get('Enhanced_Synopsis', 'No description')
+ names = _column_values(data, 'Name', 'Unknown')
+ categories = _column_values(data, 'Category', 'Unknown')
+ access_levels = _column_values(data, 'Access_Level', 'Unknown')
  
  # Truncate long descriptions
- if len(description) > 100:
- description = description[:97] + "..."
+ if 'Enhanced_Synopsis' in data.columns:
+ synopsis = data['Enhanced_Synopsis']
+ descriptions = np.where(synopsis.str.len() > 100, synopsis.str.slice(0, 97) + "...", synopsis)
+ else:
+ descriptions = _column_values(data, 'Enhanced_Synopsis', 'No description')
+ 
+ self._display_columns = (names, categories, access_levels, descriptions)
+ self._refresh_tree(0)
+ 
+ def _refresh_tree(self, first):
+ """Render only the rows currently in view into the tree"""
+ total = len(self._display_columns[0])
+ first = max(0, min(first, total - self._view_size))
+ last = min(first + self._view_size, total)
+ self._view_first = first
  
+ self.tree.delete(*self.tree.get_children())
+ rows = zip(*[column[first:last] for column in self._display_columns])
+ for position, (name, category, access, description) in enumerate(rows, first):
  self.tree.insert("", tk.END, text=name, 
  values=(category, access, description),
- tags=(row.name,)) # Store row index in tags
+ tags=(position,)) # Store row position in tags
+ 
+ if total:
+ self.v_scrollbar.set(first / total, last / total)
+ else:
+ self.v_scrollbar.set(0, 1)
+ 
+ def _on_tree_scroll(self, action, amount, unit=None):
+ """Vertical scrollbar command for the tree viewport"""
+ if action == 'moveto':
+ first = int(float(amount) * len(self._display_columns[0]))
+ else:
+ step = self._view_size if unit == 'pages' else 1
+ first = self._view_first + int(amount) * step
+ self._refresh_tree(first)
+ 
+ def _on_tree_wheel(self, event):
+ """Scroll the tree viewport with the mouse wheel"""
+ up = event.num == 4 or event.delta > 0
+ self._refresh_tree(self._view_first + (-3 if up else 3))
+ return 'break'
+ 
+ def _on_tree_resize(self, event):
+ """Fit the viewport to the rows the widget can show (less the heading row)"""
+ self._view_size = max(1, event.height // self._row_height - 1)
+ self._refresh_tree(self._view_first)
+ 
+ def count_levels(self):
+ """Count tools per category and access level once per load, for the filter dropdowns"""
+ self._cat_counts, self._acc_counts, self._categories, self._access_levels = _level_counts(self.df)
  
  def update_filters(self):
  """Update filter dropdown options"""
  if self.df is None:
  return
  
- # Update category options
- categories = ["All"] + sorted(self.df['Category'].unique().tolist())
+ # Update category options from the counts taken at load
+ categories = ["All"] + self._categories
  self.category_combo['values'] = categories
  self.category_combo.set("All")
  
  def on_search(self, event=None):
- """Handle search input"""
+ """Handle search input, filtering once typing pauses for 150 ms"""
+ if self._search_after_id:
+ self.root.after_cancel(self._search_after_id)
+ self._search_after_id = self.root.after(150, self._run_search)
+ 
+ def _run_search(self):
+ """Apply the debounced search"""
+ self._search_after_id = None
  self.apply_filters()
  
  def on_filter(self, event=None):
@@ -441,26 +856,25 @@ class BusinessToolsGUI:
  if self.df is None:
  return
  
- # Start with full dataset
- filtered = self.df.copy()
+ # Combine every active criterion into one mask over the full dataset
+ mask = np.ones(len(self.df), dtype=bool)
  
  # Apply search filter
  search_text = self.search_var.get().lower()
  if search_text:
- mask = (filtered['Name'].str.lower().str.contains(search_text, na=False) |
- filtered['Enhanced_Synopsis'].str.lower().str.contains(search_text, na=False))
- filtered = filtered[mask]
+ mask &= self.df['_search_lc'].str.contains(search_text, na=False, regex=False).to_numpy()
  
  # Apply category filter
  category = self.category_var.get()
  if category and category != "All":
- filtered = filtered[filtered['Category'] == category]
+ mask &= self.df['Category'].to_numpy() == category
  
  # Apply access level filter
  access = self.access_var.get()
  if access and access != "All":
- filtered = filtered[filtered['Access_Level'] == access]
+ mask &= self.df['Access_Level'].to_numpy() == access
  
+ filtered = self.df.iloc[mask]
  self.filtered_df = filtered
  self.populate_tree()
  self.status_var.set(f"Showing {len(filtered)} of {len(self.df)} tools")
@@ -504,8 +918,8 @@ class BusinessToolsGUI:
 class BusinessToolsCLI:
  """CLI interface for Business Tools Browser"""
  
- def __init__(self):
- self.processor = DataProcessor()
+ def __init__(self, check_urls=True):
+ self.processor = DataProcessor(check_urls)
  self.df = None
  self.load_data()
  
@@ -513,7 +927,8 @@ class BusinessToolsCLI:
  """Load data from CSV file"""
  try:
  if self.processor.cleaned_csv.exists():
- self.df = pd.read_csv(self.processor.cleaned_csv)
+ self.df = self.processor.load_cleaned()
+ self.count_levels()
  else:
  # Try to find and process an Excel file automatically
  excel_file = find_excel_file()
@@ -522,7 +937,8 @@ class BusinessToolsCLI:
  print("Processing...")
  success, message = self.processor.process_excel_file(excel_file)
  if success:
- self.df = pd.read_csv(self.processor.cleaned_csv)
+ self.df = self.processor.load_cleaned()
+ self.count_levels()
  print(f"SUCCESS: {message}")
  else:
  print(f"ERROR: {message}")
@@ -531,6 +947,10 @@ class BusinessToolsCLI:
  except Exception as e:
  print(f"Error loading data: {str(e)}")
  
+ def count_levels(self):
+ """Count tools per category and access level once per load, for the menus and statistics"""
+ self._cat_counts, self._acc_counts, self._categories, self._access_levels = _level_counts(self.df)
+ 
  def display_menu(self):
  """Display main menu"""
  print("\n" + "="*50)
@@ -600,12 +1020,11 @@ class BusinessToolsCLI:
  print("No data available.")
  return
  
- categories = sorted(self.df['Category'].unique())
+ categories = self._categories
  
  print("\nAvailable Categories:")
  for i, category in enumerate(categories, 1):
- count = len(self.df[self.df['Category'] == category])
- print(f"{i}. {category} ({count} tools)")
+ print(f"{i}. {category} ({self._cat_counts[category]} tools)")
  
  try:
  choice = int(input(f"\nSelect category (1-{len(categories)}): ")) - 1
@@ -635,12 +1054,11 @@ class BusinessToolsCLI:
  print("No data available.")
  return
  
- access_levels = sorted(self.df['Access_Level'].unique())
+ access_levels = self._access_levels
  
  print("\nAvailable Access Levels:")
  for i, level in enumerate(access_levels, 1):
- count = len(self.df[self.df['Access_Level'] == level])
- print(f"{i}. {level} ({count} tools)")
+ print(f"{i}. {level} ({self._acc_counts[level]} tools)")
  
  try:
  choice = int(input(f"\nSelect access level (1-{len(access_levels)}): ")) - 1
@@ -691,13 +1109,11 @@ class BusinessToolsCLI:
  print(f"Total Tools: {len(self.df)}")
  
  print(f"\nBy Category:")
- category_counts = self.df['Category'].value_counts()
- for category, count in category_counts.items():
+ for category, count in self._cat_counts.items():
  print(f" {category}: {count}")
  
  print(f"\nBy Access Level:")
- access_counts = self.df['Access_Level'].value_counts()
- for access, count in access_counts.items():
+ for access, count in self._acc_counts.items():
  print(f" {access}: {count}")
  
  def run(self):
@@ -739,24 +1155,26 @@ def main():
  parser = argparse.ArgumentParser(description="Business Tools Browser")
  parser.add_argument("--cli", action="store_true", help="Run in CLI mode")
  parser.add_argument("--process", type=str, help="Process Excel file and exit")
+ parser.add_argument("--no-check-urls", action="store_true",
+ help="Keep all rows without checking that their URLs respond")
  
  args = parser.parse_args()
  
  if args.process:
  # Process file mode
- processor = DataProcessor()
+ processor = DataProcessor(check_urls=not args.no_check_urls)
  success, message = processor.process_excel_file(args.process)
  print(message)
  sys.exit(0 if success else 1)
  
  elif args.cli:
  # CLI mode
- app = BusinessToolsCLI()
+ app = BusinessToolsCLI(check_urls=not args.no_check_urls)
  app.run()
  
  else:
  # GUI mode (default)
- app = BusinessToolsGUI()
+ app = BusinessToolsGUI(check_urls=not args.no_check_urls)
  app.run()
 
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the spreadsheet import and sorting helpers in the
+business tools launcher, pinned to the behavior of the original pandas code.
+"""
+
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent
+
+
+def _load_business_tools():
+    """Import the launcher module, whose file name has no .py suffix"""
+    if 'business_tools_launcher' in sys.modules:
+        return sys.modules['business_tools_launcher']
+    path = ROOT / 'business_tools.py.backup-before-recreation'
+    loader = importlib.machinery.SourceFileLoader('business_tools_launcher', str(path))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[loader.name] = module
+    loader.exec_module(module)
+    return module
+
+
+bt = _load_business_tools()
+
+# Sort keys with ties, missing values and mixed case, as they reach _sort_order
+SORT_CASES = [
+    np.array(['b', 'a', 'c', 'a', 'b'], dtype=object),
+    np.array(['delta', None, 'alpha', 'delta', np.nan, 'charlie'], dtype=object),
+    np.array([3.0, np.nan, 1.0, 3.0, 2.0, 1.0]),
+    np.array([5, 4, 4, 2, 1]),
+    np.array([], dtype=object),
+    np.array([None, None], dtype=object),
+]
+
+
+def _reference_order(values, ascending):
+    """Row order of the original sort_values(..., na_position='last'), made stable"""
+    return pd.Series(values).sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+
+
+@pytest.mark.parametrize('ascending', [True, False])
+@pytest.mark.parametrize('values', SORT_CASES)
+def test_sort_order_matches_stable_sort_values(values, ascending):
+    order = bt._sort_order(values, ascending)
+    assert order.tolist() == _reference_order(values, ascending).tolist()
+
+
+def test_sort_order_keeps_ties_in_input_order_descending():
+    values = np.array(['x', 'y', 'x', 'y'], dtype=object)
+    assert bt._sort_order(values, ascending=False).tolist() == [1, 3, 0, 2]
+
+
+@pytest.mark.parametrize('ascending', [True, False])
+@pytest.mark.parametrize('values', SORT_CASES)
+def test_is_sorted_only_when_sorting_would_not_move_rows(values, ascending):
+    unchanged = bt._sort_order(values, ascending).tolist() == list(range(len(values)))
+    assert bt._is_sorted(values, ascending) is unchanged
+    ordered = values[bt._sort_order(values, ascending)]
+    assert bt._is_sorted(ordered, ascending)
+
+
+def test_is_sorted_rejects_missing_values_before_present_ones():
+    assert not bt._is_sorted(np.array([None, 'a', 'b'], dtype=object))
+    assert bt._is_sorted(np.array(['a', 'b', None], dtype=object))
+
+
+# Cell values that Tcl would otherwise split, substitute or evaluate
+TCL_VALUES = ['', 'plain', 'two words', 'tab\tseparated', 'line one\nline two', 'carriage\rreturn',
+              '{open', 'close}', '{braced}', '[exit 1]', '$env(HOME)', 'say "hi"', 'a;b',
+              'back\\slash', 'trailing\\', '#comment', 'ünïcödé €', 'nan', 42, 3.5, None]
+
+
+def test_tcl_word_round_trips_cell_values():
+    tkinter = pytest.importorskip('tkinter')
+    try:
+        interp = tkinter.Tcl()
+    except tkinter.TclError as e:
+        pytest.skip(f"Tcl unavailable: {e}")
+    words = ' '.join(map(bt._tcl_word, TCL_VALUES))
+    # The viewport script passes row values as [list ...]; Tk must see the same strings as insert(values=...)
+    result = interp.eval(f"list {words}")
+    assert interp.splitlist(result) == tuple(str(value) for value in TCL_VALUES)
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    """DataProcessor with a private URL cache and no network access"""
+    monkeypatch.setattr(bt, 'URL_CACHE_FILE', tmp_path / 'url_cache.sqlite')
+    monkeypatch.setattr(bt, 'fetch_url_descriptions', lambda urls: [(None, '')] * len(urls))
+    return bt.DataProcessor()
+
+
+def test_csv_import_skips_malformed_rows_with_a_warning(processor, tmp_path, capsys):
+    path = tmp_path / 'tools.csv'
+    path.write_text('Name,URL\nAlpha,https://a.example\nBeta,https://b.example,extra\nGamma,https://c.example\n',
+                    encoding='utf-8')
+    df = processor.import_data_file(str(path), sort=False, export_consolidated_csv=False)
+    assert df is not None
+    assert df['Name'].tolist() == ['Alpha', 'Gamma']
+    assert 'Skipped 1 malformed row(s)' in capsys.readouterr().out
+
+
+def test_csv_import_of_well_formed_file_reports_no_malformed_rows(processor, tmp_path, capsys):
+    path = tmp_path / 'tools.csv'
+    path.write_text('Name,URL\nAlpha,https://a.example\nBeta,"https://b.example/?a=1,2"\n', encoding='utf-8')
+    df = processor.import_data_file(str(path), sort=False, export_consolidated_csv=False)
+    assert df['Name'].tolist() == ['Alpha', 'Beta']
+    assert 'malformed' not in capsys.readouterr().out
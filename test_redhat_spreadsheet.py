@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the tool spreadsheet classifiers, pinned to the
+original row-by-row description, category and access rules.
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+import business_tools_app as app
+import business_tools_app_backup as bk
+
+# (Name, Synopsis, URL) rows covering every rule, rule precedence, canned descriptions
+# that change the category, missing values and non-ASCII text
+ROWS = [
+    ('Draw.io', 'Online DIAGRAM editor', 'https://app.diagrams.net'),
+    ('Labs', 'Hands-on learning labs', 'https://labs.example.com'),
+    ('Vault', 'Token based authentication', 'https://vault.example.com'),
+    ('OBS', 'Video streaming and recording', 'https://obsproject.com'),
+    ('tmux', 'Terminal multiplexer', 'https://github.com/tmux/tmux'),
+    ('GitLab', 'Git repository hosting', 'https://gitlab.example.com'),
+    ('Zoom', 'Meeting and conference calls', 'https://zoom.us'),
+    ('AWX', 'Ansible automation controller', 'https://www.redhat.com/awx'),
+    ('Source', 'Staff portal', 'https://source.example.com'),
+    ('Mojo', 'Confidential wiki', 'https://mojo.example.com/CORP'),
+    ('Trainer', 'Training videos', 'https://training.example.com'),
+    ('Multi', 'Diagram of terminal video tokens', 'https://intranet.example.com'),
+    ('Plain', 'A calculator', 'https://calc.example.org'),
+    ('Unicode', 'Gérer les vidéos — Überblick', 'https://例え.jp'),
+    ('Blank', '', ''),
+    ('Missing', None, None),
+]
+
+
+def _frame(synopsis_col='Synopsis'):
+    return pd.DataFrame(ROWS, columns=['Name', synopsis_col, 'URL'])
+
+
+def _original_description(row, df):
+    """Original enhance_description(row, df)"""
+    synopsis_col = 'Synopsis' if 'Synopsis' in df.columns else 'Description' if 'Description' in df.columns else None
+    if synopsis_col is None:
+        return "Tool description not available"
+    synopsis = str(row[synopsis_col]).lower()
+    if "diagram" in synopsis:
+        return "Tool for creating flowcharts, architecture maps, and process diagrams."
+    elif "learning" in synopsis or "labs" in synopsis:
+        return "Interactive learning tools and environments for business technologies."
+    elif "authentic" in synopsis or "token" in synopsis:
+        return "Authentication and identity tools for secure access control."
+    elif "stream" in synopsis or "video" in synopsis:
+        return "Utilities for recording, streaming, and multimedia editing."
+    elif "terminal" in synopsis:
+        return "CLI tools for sysadmin workflows and shell automation."
+    elif "git" in synopsis:
+        return "Repositories or tools for managing source code and collaboration."
+    return row[synopsis_col]
+
+
+def _original_category(row):
+    """Original categorize(row)"""
+    desc = str(row["Enhanced_Synopsis"]).lower()
+    if "authentication" in desc or "token" in desc:
+        return "Security"
+    elif "learning" in desc or "labs" in desc or "training" in desc:
+        return "Education"
+    elif "diagram" in desc:
+        return "Diagramming"
+    elif "stream" in desc or "video" in desc or "recording" in desc:
+        return "Media Tools"
+    elif "git" in desc or "repository" in desc:
+        return "Code Repositories"
+    elif "meeting" in desc or "conference" in desc:
+        return "Meetings"
+    elif "automation" in desc or "ansible" in desc:
+        return "Automation"
+    elif "terminal" in desc:
+        return "CLI Utilities"
+    return "General Utilities"
+
+
+def _original_access(row):
+    """Original classify_tool_access(row)"""
+    url = str(row.get('URL', '')).lower()
+    synopsis = str(row.get('Enhanced_Synopsis', '')).lower()
+    internal_indicators = [
+        'redhat.com', 'internal', 'intranet', 'corp', 'employee',
+        'staff', 'private', 'restricted', 'confidential'
+    ]
+    for indicator in internal_indicators:
+        if indicator in url or indicator in synopsis:
+            return 'Internal'
+    return 'Public'
+
+
+def _original_columns(df):
+    """Enhanced_Synopsis, Category and Access_Level as the original df.apply pipeline built them"""
+    df = df.copy()
+    df["Enhanced_Synopsis"] = df.apply(lambda row: _original_description(row, df), axis=1)
+    df["Category"] = df.apply(_original_category, axis=1)
+    df["Access_Level"] = df.apply(_original_access, axis=1)
+    return df["Enhanced_Synopsis"].tolist(), df["Category"].tolist(), df["Access_Level"].tolist()
+
+
+def _vectorized_columns(processor, df):
+    """The same columns from the vectorized methods, as process_excel_file calls them"""
+    df = df.copy()
+    df["Enhanced_Synopsis"] = processor.enhance_description(df)
+    synopsis_lc = bk._lower_text(df["Enhanced_Synopsis"])
+    return (df["Enhanced_Synopsis"].tolist(), list(processor.categorize(df, synopsis_lc)),
+            list(processor.classify_tool_access(df, synopsis_lc)))
+
+
+def _assert_same(actual, expected):
+    for got, want in zip(actual, expected):
+        # Missing synopses stay missing, whatever the missing-value marker
+        assert [None if pd.isna(value) else value for value in got] == \
+               [None if pd.isna(value) else value for value in want]
+
+
+@pytest.fixture
+def regex_processor():
+    """DataProcessor forced onto the np.select/regex path"""
+    processor = bk.DataProcessor(check_urls=False)
+    processor._description_automaton = processor._category_automaton = processor._internal_automaton = None
+    return processor
+
+
+@pytest.mark.parametrize('synopsis_col', ['Synopsis', 'Description'])
+def test_select_rules_match_original_classification(regex_processor, synopsis_col):
+    df = _frame(synopsis_col)
+    _assert_same(_vectorized_columns(regex_processor, df), _original_columns(df))
+
+
+def test_description_without_synopsis_column(regex_processor):
+    df = _frame().drop(columns='Synopsis')
+    assert list(regex_processor.enhance_description(df)) == ["Tool description not available"] * len(df)
+
+
+@pytest.mark.skipif(bk.ahocorasick is None, reason="pyahocorasick not installed")
+@pytest.mark.parametrize('synopsis_col', ['Synopsis', 'Description'])
+def test_automaton_rules_match_original_classification(synopsis_col):
+    processor = bk.DataProcessor(check_urls=False)
+    assert processor._description_automaton is not None
+    df = _frame(synopsis_col)
+    _assert_same(_vectorized_columns(processor, df), _original_columns(df))
+
+
+@pytest.mark.skipif(bk.njit is None, reason="numba not installed")
+@pytest.mark.parametrize('synopsis_col', ['Synopsis', 'Description'])
+def test_fused_kernel_matches_original_classification(synopsis_col):
+    processor = bk.DataProcessor(check_urls=False)
+    df = _frame(synopsis_col)
+    enhanced, category, access = processor.classify_fused(df, synopsis_col)
+    _assert_same((list(enhanced), list(category), list(access)), _original_columns(df))
+
+
+@pytest.mark.skipif(bk.njit is None, reason="numba not installed")
+def test_fused_kernel_without_url_column():
+    processor = bk.DataProcessor(check_urls=False)
+    df = _frame().drop(columns='URL')
+    enhanced, category, access = processor.classify_fused(df, 'Synopsis')
+    _assert_same((list(enhanced), list(category), list(access)), _original_columns(df))
+
+
+def _original_app_access(row):
+    """Original business_tools_app DataProcessor.classify_tool_access(row)"""
+    url = str(row.get('url', '')).lower()
+    description = str(row.get('description', '')).lower()
+    name = str(row.get('name', '')).lower()
+    internal_keywords = ['internal', 'intranet', 'private', 'corp', 'company', 'localhost', '192.168', '10.0', '172.16']
+    public_keywords = ['public', 'open', 'free', 'community', 'github', 'google', 'microsoft']
+    for keyword in internal_keywords:
+        if keyword in url or keyword in description or keyword in name:
+            return 'Internal'
+    for keyword in public_keywords:
+        if keyword in url or keyword in description or keyword in name:
+            return 'Public'
+    if any(domain in url for domain in ['.com', '.org', '.net', '.gov', '.edu']):
+        return 'Public'
+    return 'Unknown'
+
+
+# (name, description, url) rows for the master data access classifier
+APP_ROWS = [
+    ('Wiki', 'Team pages', 'https://intranet.example.io'),
+    ('Dashboard', 'Local dev server', 'http://localhost:8080'),
+    ('Router', 'Admin page', 'http://10.0.0.1'),
+    ('GitHub Desktop', 'Git client', 'https://desktop.example.io'),
+    ('Mirror', 'Private GitHub mirror', 'https://mirror.example.io'),
+    ('OpenShift', 'Container platform', 'https://www.OPENSHIFT.com'),
+    ('Calculator', 'Numbers', 'https://calc.example.org'),
+    ('Tool', 'Does things', 'https://tool.example.io'),
+    ('intra', 'net', 'https://split.example.io'),
+    ('Blank', '', ''),
+    (None, None, None),
+]
+
+
+def _app_frame():
+    return pd.DataFrame(APP_ROWS, columns=['name', 'description', 'url'])
+
+
+def test_app_access_select_matches_original(monkeypatch):
+    monkeypatch.setattr(app, 'ahocorasick', None)
+    df = _app_frame()
+    expected = [_original_app_access(row) for _, row in df.iterrows()]
+    assert list(app.DataProcessor().classify_tool_access(df)) == expected
+
+
+@pytest.mark.skipif(app.ahocorasick is None, reason="pyahocorasick not installed")
+def test_app_access_automaton_matches_original():
+    df = _app_frame()
+    expected = [_original_app_access(row) for _, row in df.iterrows()]
+    assert list(app.DataProcessor().classify_tool_access(df)) == expected
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the URL description and link status caches: entries
+are reused within their TTL, refreshed after it, and failures never stick.
+"""
+
+import importlib.machinery
+import importlib.util
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+import business_tools_app as app
+import business_tools_app_backup as bk
+
+
+def _load_business_tools():
+    """Import the launcher module, whose file name has no .py suffix"""
+    if 'business_tools_launcher' in sys.modules:
+        return sys.modules['business_tools_launcher']
+    path = ROOT / 'business_tools.py.backup-before-recreation'
+    loader = importlib.machinery.SourceFileLoader('business_tools_launcher', str(path))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[loader.name] = module
+    loader.exec_module(module)
+    return module
+
+
+bt = _load_business_tools()
+
+
+@pytest.fixture
+def description_fetches(tmp_path, monkeypatch):
+    """Record the URL batches the launcher fetches; URLs containing 'down' get no response"""
+    calls = []
+
+    def fetch(urls):
+        calls.append(list(urls))
+        return [(None, '') if 'down' in url else (200, f"About {url}") for url in urls]
+
+    monkeypatch.setattr(bt, 'URL_CACHE_FILE', tmp_path / 'url_cache.sqlite')
+    monkeypatch.setattr(bt, 'fetch_url_descriptions', fetch)
+    return calls
+
+
+def test_descriptions_are_reused_from_disk_within_ttl(description_fetches):
+    urls = ['https://a.example', 'https://b.example', 'https://a.example']
+    expected = [(200, 'About https://a.example'), (200, 'About https://b.example'), (200, 'About https://a.example')]
+    assert bt.DataProcessor().fetch_descriptions(urls) == expected
+    # A new processor starts with an empty in-memory cache, so these come from SQLite
+    assert bt.DataProcessor().fetch_descriptions(urls) == expected
+    assert description_fetches == [['https://a.example', 'https://b.example']]
+
+
+def test_descriptions_older_than_ttl_are_fetched_again(description_fetches, tmp_path):
+    bt.DataProcessor().fetch_descriptions(['https://a.example'])
+    db = sqlite3.connect(tmp_path / 'url_cache.sqlite')
+    with db:
+        db.execute('UPDATE url_cache SET ts = ts - ?', (bt.URL_CACHE_TTL + 1,))
+    db.close()
+    bt.DataProcessor().fetch_descriptions(['https://a.example'])
+    assert description_fetches == [['https://a.example'], ['https://a.example']]
+
+
+def test_descriptions_without_a_response_are_not_persisted(description_fetches):
+    assert bt.DataProcessor().fetch_descriptions(['https://down.example']) == [(None, '')]
+    bt.DataProcessor().fetch_descriptions(['https://down.example'])
+    assert description_fetches == [['https://down.example'], ['https://down.example']]
+
+
+class _Response:
+    """Just the parts of an HTTP response LinkValidator reads"""
+
+    def __init__(self, status_code, etag=None):
+        self.status_code = status_code
+        self.headers = {'ETag': etag} if etag else {}
+
+
+@pytest.fixture
+def validator(tmp_path):
+    return app.LinkValidator(cache_ttl=3600, cache_path=tmp_path / 'link_cache.sqlite')
+
+
+def _serve(monkeypatch, validator, *responses):
+    """Answer HEAD requests with responses (or raise exceptions) in turn; returns the headers sent"""
+    sent = []
+    pending = list(responses)
+
+    def head(url, timeout=None, allow_redirects=True, headers=None):
+        sent.append(headers)
+        response = pending.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    monkeypatch.setattr(validator.session, 'head', head)
+    return sent
+
+
+def _age_link_cache(validator, seconds):
+    with validator._cache_lock:
+        validator._cache_db.execute('UPDATE link_cache SET checked = checked - ?', (seconds,))
+        validator._cache_db.commit()
+
+
+def test_link_results_are_reused_within_ttl(validator, monkeypatch):
+    sent = _serve(monkeypatch, validator, _Response(200))
+    first = validator.validate_url('https://tools.example.com/Docs')
+    # Spellings differing only in case, fragment or trailing slash share one cache entry
+    second = validator.validate_url('https://TOOLS.example.com/docs/#intro')
+    assert first['status'] == second['status'] == 'valid'
+    assert first['code'] == second['code'] == 200
+    assert sent == [None]
+
+
+def test_stale_link_is_revalidated_with_its_etag(validator, monkeypatch):
+    sent = _serve(monkeypatch, validator, _Response(200, etag='"v1"'), _Response(304))
+    validator.validate_url('https://tools.example.com')
+    _age_link_cache(validator, validator.cache_ttl + 1)
+    result = validator.validate_url('https://tools.example.com')
+    assert sent == [None, {'If-None-Match': '"v1"'}]
+    assert (result['status'], result['code'], result['message']) == ('valid', 200, 'OK')
+    # The 304 refreshed the entry and kept its ETag
+    assert validator.validate_url('https://tools.example.com')['code'] == 200
+    assert validator._cache_lookup(app.normalize_url('https://tools.example.com'))['etag'] == '"v1"'
+    assert len(sent) == 2
+
+
+def test_stale_link_that_changed_is_recorded_again(validator, monkeypatch):
+    _serve(monkeypatch, validator, _Response(200, etag='"v1"'), _Response(404))
+    validator.validate_url('https://tools.example.com')
+    _age_link_cache(validator, validator.cache_ttl + 1)
+    result = validator.validate_url('https://tools.example.com')
+    assert (result['status'], result['code']) == ('error', 404)
+    assert validator._cache_lookup(app.normalize_url('https://tools.example.com'))['etag'] is None
+
+
+def test_stale_link_without_etag_is_checked_unconditionally(validator, monkeypatch):
+    sent = _serve(monkeypatch, validator, _Response(200), _Response(200))
+    validator.validate_url('https://tools.example.com')
+    _age_link_cache(validator, validator.cache_ttl + 1)
+    validator.validate_url('https://tools.example.com')
+    assert sent == [None, None]
+
+
+def test_unreachable_links_are_not_cached(validator, monkeypatch):
+    sent = _serve(monkeypatch, validator, requests.exceptions.ConnectionError(), _Response(200))
+    assert validator.validate_url('https://tools.example.com')['status'] == 'connection_error'
+    assert validator.validate_url('https://tools.example.com')['status'] == 'valid'
+    assert len(sent) == 2
+
+
+@pytest.fixture
+def url_checks(tmp_path, monkeypatch):
+    """Keep the URL status cache under tmp_path and record the URL batches probed"""
+    monkeypatch.setattr(bk, 'DATA_DIR', tmp_path)
+    calls = []
+
+    def check_urls(self, urls):
+        calls.append(list(urls))
+        return ['Invalid' if 'down' in url else 'OK' for url in urls]
+
+    monkeypatch.setattr(bk.DataProcessor, 'check_urls', check_urls)
+    return calls
+
+
+def test_url_status_is_reused_from_disk_within_ttl(url_checks):
+    urls = ['https://a.example', 'https://b.example']
+    assert bk.DataProcessor().cached_url_status(urls) == {'https://a.example': 'OK', 'https://b.example': 'OK'}
+    # A new processor reloads the statuses saved by the first one
+    assert bk.DataProcessor().cached_url_status(urls) == {'https://a.example': 'OK', 'https://b.example': 'OK'}
+    assert url_checks == [urls]
+
+
+def test_url_status_older_than_ttl_is_checked_again(url_checks, tmp_path):
+    bk.DataProcessor().cached_url_status(['https://a.example', 'https://b.example'])
+    cache_file = tmp_path / 'url_status.json'
+    cache = json.loads(cache_file.read_text())
+    cache['https://a.example'][1] -= bk.URL_CACHE_TTL + 1
+    cache_file.write_text(json.dumps(cache))
+    bk.DataProcessor().cached_url_status(['https://a.example', 'https://b.example'])
+    assert url_checks == [['https://a.example', 'https://b.example'], ['https://a.example']]
+
+
+def test_unreachable_url_status_is_not_cached(url_checks):
+    assert bk.DataProcessor().cached_url_status(['https://down.example']) == {'https://down.example': 'Invalid'}
+    bk.DataProcessor().cached_url_status(['https://down.example'])
+    assert url_checks == [['https://down.example'], ['https://down.example']]